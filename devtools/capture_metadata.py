@@ -5,6 +5,7 @@ import argparse
 import signal
 import sys
 import time
+from typing import Mapping
 
 from nowplaying.capture_replay import create_capture_filename
 from nowplaying.metadata_monitor import StateMonitor
@@ -38,9 +39,9 @@ def main():
     print("-" * 60)
 
     # Set up callbacks
-    def metadata_callback(metadata: dict) -> None:
+    def metadata_callback(metadata: Mapping[str, str]) -> None:
         if args.verbose:
-            print(f"Metadata: {metadata}")
+            print(f"Metadata: {dict(metadata)}")
         else:
             # Show key fields
             fields = []
@@ -34,7 +34,7 @@ import signal
 import sys
 import threading
 import time
-from typing import List, Optional, Tuple
+from typing import List, Mapping, Optional, Tuple
 
 import pygame
 
@@ -236,7 +236,7 @@ class UIModel:
         self.content_context = ContentContext()
 
     # Metadata callback from monitor
-    def on_metadata(self, m: dict):
+    def on_metadata(self, m: Mapping[str, str]):
         """Handle metadata updates from the metadata monitor."""
         with self._lock:
             self.artist = m.get("artist", self.artist)
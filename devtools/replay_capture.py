@@ -4,6 +4,7 @@
 import argparse
 import sys
 import time
+from typing import Mapping
 
 from nowplaying.capture_replay import MetadataReplay
 from nowplaying.metadata_reader import ShairportSyncPipeReader
@@ -66,11 +67,11 @@ def main():
     metadata_count = 0
     state_changes = 0
 
-    def metadata_callback(metadata: dict) -> None:
+    def metadata_callback(metadata: Mapping[str, str]) -> None:
         nonlocal metadata_count
         metadata_count += 1
         if args.verbose:
-            print(f"Metadata #{metadata_count}: {metadata}")
+            print(f"Metadata #{metadata_count}: {dict(metadata)}")
         else:
             # Show key fields
             fields = []
@@ -105,6 +106,8 @@ def main():
     try:
         start_time = time.time()
         replay.replay(line_callback, event_callback if args.verbose else None)
+        # Cover art updates are dispatched from the writer thread once their files are saved
+        metadata_reader.flush_cover_art()
         end_time = time.time()
 
         print("-" * 60)
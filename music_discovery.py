@@ -18,7 +18,7 @@ import signal
 import sys
 from contextlib import redirect_stderr
 from io import StringIO
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 import pygame
 
@@ -208,9 +208,15 @@ class DiscoveryApp:
             # Disable text input events completely
             pygame.key.stop_text_input()
 
+            # Nothing reacts to pointer movement (swipes use button down/up), so have SDL
+            # drop motion events instead of queueing one per mouse sample
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+
             # Additional pygame keyboard settings
             pygame.key.set_repeat(0)  # Disable key repeat completely
 
+            self.navigator.set_display_size(*self.screen.get_size())
+
             self.logger.info(
                 "Display initialized: %dx%d (%s mode)",
                 self.screen.get_width(),
@@ -279,7 +285,7 @@ class DiscoveryApp:
             self.logger.error("Failed to initialize monitor: %s", e)
             return False
 
-    def _on_metadata(self, metadata: dict) -> None:
+    def _on_metadata(self, metadata: Mapping[str, str]) -> None:
         """Process and apply metadata updates."""
         try:
             # Create content context
@@ -321,7 +327,8 @@ class DiscoveryApp:
 
     def handle_events(self) -> bool:
         """Handle pygame events."""
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
 
@@ -331,12 +338,9 @@ class DiscoveryApp:
                 elif event.key == pygame.K_F11:
                     self._toggle_fullscreen()
 
-            # Filter out text input events to prevent virtual keyboard
-            elif event.type == pygame.TEXTINPUT or event.type == pygame.TEXTEDITING:
-                continue
-
-            # Let navigator handle navigation events
-            self.navigator.handle_event(event)
+        # Let navigator handle navigation events as one batch (text input events
+        # are filtered out there, which keeps the virtual keyboard from appearing)
+        self.navigator.handle_events(events)
 
         return True
 
@@ -358,6 +362,7 @@ class DiscoveryApp:
             self.screen = pygame.display.set_mode((1200, 800))
             pygame.mouse.set_visible(True)
 
+        self.navigator.set_display_size(*self.screen.get_size())
         self.logger.info("Toggled to %s mode", self.display_mode)
 
     def render(self) -> None:
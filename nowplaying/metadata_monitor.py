@@ -6,7 +6,7 @@ import select
 import sys
 import threading
 import uuid
-from typing import Callable, Optional
+from typing import Callable, Mapping, Optional
 
 from .capture_replay import MetadataCapture
 from .config import StateMonitorConfig
@@ -44,7 +44,7 @@ class StateMonitor:
     def __init__(
         self,
         pipe_path: Optional[str] = None,
-        metadata_callback: Optional[Callable[[dict], None]] = None,
+        metadata_callback: Optional[Callable[[Mapping[str, str]], None]] = None,
         state_callback: Optional[Callable[[PlaybackState], None]] = None,
         config: Optional[StateMonitorConfig] = None,
         capture_file: Optional[str] = None,
@@ -276,7 +276,7 @@ class StateMonitor:
         }
         self._metadata_callback(empty_metadata)
 
-    def _default_metadata_callback(self, metadata: dict) -> None:
+    def _default_metadata_callback(self, metadata: Mapping[str, str]) -> None:
         """Log published metadata."""
         log_metadata.info("Published metadata: %s", metadata)
 
@@ -1,11 +1,21 @@
 """Shairport-sync metadata reader for parsing XML format metadata from pipes."""
 
-import base64
+import binascii
+import errno
+import functools
 import hashlib
+import logging
+import mmap
+import os
+import queue
 import re
 import struct
+import sys
+import threading
 import uuid
-from typing import Callable, Dict
+from collections import Counter
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
 
 from .module_registry import module_registry
 from .playback_state import PlaybackState
@@ -48,6 +58,190 @@ module_registry.register_module(
 # Get logger for this module
 log = module_registry.get_module_info("shairport")["logger"]
 
+# NUL and the other C0 control bytes, except tab/newline/carriage return. UTF-8
+# continuation bytes are always >= 0x80, so this test is exact for decoded text.
+_CONTROL_BYTES = bytes(b for b in range(0x20) if b not in b"\t\n\r")
+
+
+def _has_control_bytes(payload: bytes) -> bool:
+    """Return True if the (whitespace-stripped) payload contains binary control bytes."""
+    stripped = payload.strip()
+    return len(stripped.translate(None, _CONTROL_BYTES)) != len(stripped)
+
+
+class CoverArtWriter:
+    """Saves cover art files on a background thread so pipe parsing never blocks on disk I/O.
+
+    There is no stdlib io_uring binding, so writes are handed to a single writer thread
+    through a queue. The optional completion callback runs on that thread once the file
+    has been written.
+
+    Where the filesystem supports it, files are written with O_DIRECT from a reusable
+    page-aligned buffer so large images don't churn the page cache.
+
+    The queue is bounded: a write submitted under the key of one that is still waiting
+    replaces it, and once the queue is full the oldest waiting write is dropped, so a
+    slow disk skips stale images instead of piling them up or stalling the reader.
+    """
+
+    MAX_PENDING = 4
+
+    def __init__(self):
+        """Initialize the writer; the worker thread is started on first use."""
+        # The queue carries keys; the latest write for each key waits in _pending
+        self._queue: "queue.Queue" = queue.Queue(maxsize=self.MAX_PENDING)
+        self._pending: Dict[object, tuple] = {}
+        self._pending_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._direct_io = hasattr(os, "O_DIRECT")
+        self._aligned_buffer: Optional[mmap.mmap] = None
+
+    def submit(
+        self,
+        filename: str,
+        payload: bytes,
+        on_written: Optional[Callable[[], None]] = None,
+        key: Optional[str] = None,
+    ) -> None:
+        """Queue a cover art write, calling on_written once the file is on disk (new or existing).
+
+        A write still waiting under the same key (e.g. metadata_id) is replaced and its
+        callback dropped. Never blocks: when MAX_PENDING writes are already waiting, the
+        oldest is dropped along with its callback.
+        """
+        self._ensure_started()
+        if key is None:
+            key = object()  # Never coalesced
+        with self._pending_lock:
+            if key in self._pending:
+                self._pending[key] = (filename, payload, on_written)
+                log.debug("Replaced pending cover art write with %s", filename)
+                return
+            if self._queue.full():
+                # Only submit() adds keys, under this lock, so the queue can't refill meanwhile
+                oldest = self._queue.get_nowait()
+                dropped_filename = self._pending.pop(oldest)[0]
+                self._queue.task_done()
+                log.warning("Cover art writes backed up, dropping %s", dropped_filename)
+            self._pending[key] = (filename, payload, on_written)
+            self._queue.put_nowait(key)
+
+    def flush(self) -> None:
+        """Block until all queued writes (and their callbacks) have completed."""
+        self._queue.join()
+
+    def _ensure_started(self) -> None:
+        """Start the worker thread if it is not already running."""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="cover-art-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Write queued cover art files until the process exits."""
+        while True:
+            key = self._queue.get()
+            with self._pending_lock:
+                filename, payload, on_written = self._pending.pop(key)
+            try:
+                created = self._write_file(filename, payload)
+            except Exception as e:
+                log.error("Failed to save cover art: %s", e)
+            else:
+                if created:
+                    log.info("Cover art saved to: %s", filename)
+                else:
+                    log.debug("Cover art already exists: %s", filename)
+                if on_written:
+                    try:
+                        on_written()
+                    except Exception as e:
+                        log.error("Error dispatching cover art metadata: %s", e)
+            finally:
+                self._queue.task_done()
+
+    def _write_file(self, filename: str, payload: bytes) -> bool:
+        """Create a file holding the payload, bypassing the page cache when possible.
+
+        Cover art files are named by checksum, so the file is created exclusively and
+        an existing file is left alone - the create doubles as the existence check.
+        Returns False if the file already existed.
+        """
+        if self._direct_io:
+            try:
+                self._write_direct(filename, payload)
+                return True
+            except FileExistsError:
+                return False
+            except OSError as e:
+                if e.errno != errno.EINVAL:
+                    raise
+                # tmpfs and some other filesystems reject O_DIRECT - don't try again
+                log.debug("O_DIRECT not supported for %s, using buffered writes", filename)
+                self._direct_io = False
+                # The rejected open may already have created an empty file, so overwrite it
+                self._write_buffered(filename, payload, os.O_TRUNC)
+                return True
+
+        try:
+            self._write_buffered(filename, payload, os.O_EXCL)
+        except FileExistsError:
+            return False
+        return True
+
+    def _write_buffered(self, filename: str, payload: bytes, create_flag: int) -> None:
+        """Write a payload through the page cache with a single unbuffered write call.
+
+        The payload is already one contiguous buffer, so a Python file object would only
+        add a copy through its internal buffer and split the write into chunks.
+        """
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC | create_flag, 0o644)
+        try:
+            with memoryview(payload) as view:
+                written = 0
+                while written < len(view):
+                    written += os.write(fd, view[written:])
+        except OSError:
+            os.unlink(filename)
+            raise
+        finally:
+            os.close(fd)
+
+    def _write_direct(self, filename: str, payload: bytes) -> None:
+        """Write a payload with O_DIRECT, padding to a page multiple and truncating afterwards."""
+        size = len(payload)
+        aligned_size = -(-size // mmap.PAGESIZE) * mmap.PAGESIZE
+        buffer = self._get_aligned_buffer(aligned_size)
+        buffer[:size] = payload
+
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_CLOEXEC | os.O_DIRECT, 0o644)
+        try:
+            with memoryview(buffer) as view:
+                written = 0
+                while written < aligned_size:
+                    written += os.write(fd, view[written:aligned_size])
+            os.ftruncate(fd, size)
+        except OSError:
+            # Don't leave a partial file behind - it would be taken for a complete one
+            os.unlink(filename)
+            raise
+        finally:
+            os.close(fd)
+
+    def _get_aligned_buffer(self, size: int) -> mmap.mmap:
+        """Return the pooled page-aligned buffer, growing it if it is smaller than size."""
+        if self._aligned_buffer is None or len(self._aligned_buffer) < size:
+            if self._aligned_buffer is not None:
+                self._aligned_buffer.close()
+            # Anonymous mappings are always page aligned
+            self._aligned_buffer = mmap.mmap(-1, size, flags=mmap.MAP_PRIVATE)
+        return self._aligned_buffer
+
+
+# Shared writer for all pipe readers
+cover_art_writer = CoverArtWriter()
+
 
 class ShairportSyncPipeReader:
     """Handles parsing and processing of shairport-sync metadata from XML format."""
@@ -55,15 +249,20 @@ class ShairportSyncPipeReader:
     def __init__(
         self,
         state_callback: Callable[[PlaybackState], None],
-        metadata_callback: Callable[[dict], None],
+        metadata_callback: Callable[[Mapping[str, str]], None],
     ):
         """Initialize metadata reader with callbacks for state and metadata updates."""
         self._state_callback = state_callback
         self._metadata_callback = metadata_callback
         self._current_metadata: Dict[str, str] = {}
+        # Read-only copy handed to callbacks, rebuilt lazily after _current_metadata changes
+        self._metadata_snapshot: Optional[Mapping[str, str]] = None
         self._metadata_bundle_active = False
         self._sequence_number = 0
         self._current_metadata_id = None
+        self._cover_art_writer = cover_art_writer
+        # Cover art dispatches run on the writer thread; state and metadata callbacks must never overlap
+        self._dispatch_lock = threading.Lock()
 
         # Core metadata codes from iTunes/AirPlay (DMAP format)
         self._core_metadata_codes = {
@@ -259,10 +458,17 @@ class ShairportSyncPipeReader:
             "aeXD": "Apple Extras Extra Data",
         }
 
+        # Occurrences of each unknown core code, used to rate-limit their debug logging
+        self._unknown_code_counts: Counter = Counter()
+
         # XML parsing state
         self._current_item = None
         self._collecting_data = False
-        self._data_buffer = ""
+        # Base64 text of the current item. The bytearray is kept across items and only
+        # grows to the largest payload seen (cover art), so multi-line items don't
+        # reallocate; _data_length marks how much of it belongs to the current item.
+        self._data_buffer = bytearray()
+        self._data_length = 0
 
     def process_line(self, line: str) -> None:
         """Process a single line of metadata output in XML format."""
@@ -281,11 +487,11 @@ class ShairportSyncPipeReader:
                 # Data ends on this line
                 data_part = line.replace("</data></item>", "")
                 if data_part:
-                    self._data_buffer += data_part
+                    self._append_data(data_part)
                 self._complete_current_item()
             else:
                 # Continue collecting data
-                self._data_buffer += line
+                self._append_data(line)
         # Handle item end without data
         elif line == "</item>" and self._current_item:
             self._complete_current_item()
@@ -315,14 +521,14 @@ class ShairportSyncPipeReader:
 
             # Reset data collection state
             self._collecting_data = False
-            self._data_buffer = ""
+            self._data_length = 0
 
             # Check if this line also contains data or ends immediately
             if "</item>" in line:
                 # Single line item with embedded data
                 data_match = re.search(r'<data encoding="base64">([^<]+)</data>', line)
                 if data_match:
-                    self._data_buffer = data_match.group(1)
+                    self._append_data(data_match.group(1))
                 self._complete_current_item()
             elif '<data encoding="base64">' in line:
                 # Data starts on same line
@@ -348,11 +554,21 @@ class ShairportSyncPipeReader:
             data_part = line[data_start:]
 
             # Check if data also ends on this line
+            self._data_length = 0
             if "</data></item>" in data_part:
-                self._data_buffer = data_part.replace("</data></item>", "")
+                self._append_data(data_part.replace("</data></item>", ""))
                 self._complete_current_item()
             else:
-                self._data_buffer = data_part
+                self._append_data(data_part)
+
+    def _append_data(self, text: str) -> None:
+        """Append base64 text to the reusable data buffer."""
+        # Non-ASCII characters can't be base64 and are dropped like any other stray character
+        chunk = text.encode("ascii", "replace")
+        end = self._data_length + len(chunk)
+        # Slice assignment overwrites in place, extending only past the current capacity
+        self._data_buffer[self._data_length : end] = chunk
+        self._data_length = end
 
     def _complete_current_item(self) -> None:
         """Complete processing of the current XML item."""
@@ -366,9 +582,9 @@ class ShairportSyncPipeReader:
 
             # Decode payload if present
             payload = b""
-            if length > 0 and self._data_buffer:
+            if length > 0 and self._data_length:
                 try:
-                    payload = base64.b64decode(self._data_buffer)
+                    payload = binascii.a2b_base64(memoryview(self._data_buffer)[: self._data_length])
                 except Exception as e:
                     raise Base64DecodeError(f"Failed to decode base64 data: {e}") from e
 
@@ -392,18 +608,21 @@ class ShairportSyncPipeReader:
         if code in self._core_metadata_codes:
             field_name = self._core_metadata_codes[code]
             try:
-                # Most metadata is UTF-8 encoded text
-                value = payload.decode("utf-8").strip()
-                # Check if the decoded string contains null characters or other control chars
-                # which indicates binary data that shouldn't be treated as text
-                if "\x00" in value or any(ord(c) < 32 and c not in "\n\r\t" for c in value):
+                # Null characters or other control chars indicate binary data that
+                # shouldn't be treated as text - check the raw bytes before decoding
+                if _has_control_bytes(payload):
                     log.debug(
                         "Core metadata %s: <binary data, %d bytes>",
                         field_name,
                         len(payload),
                     )
                 else:
+                    # Most metadata is UTF-8 encoded text. Field names are literal keys and
+                    # already interned; interning the values lets every bundle for the same
+                    # artist/album/genre share one string and compare by identity downstream.
+                    value = sys.intern(payload.decode("utf-8").strip())
                     self._current_metadata[field_name] = value
+                    self._metadata_snapshot = None
                     log.debug("Core metadata %s: %s", field_name, value)
             except UnicodeDecodeError as e:
                 # Some fields contain binary data (timestamps, IDs, etc.)
@@ -423,9 +642,8 @@ class ShairportSyncPipeReader:
                 if description:
                     # Known DMAP field - don't show hex
                     try:
-                        value = payload.decode("utf-8").strip()
                         # Check for binary data disguised as text
-                        if "\x00" in value or any(ord(c) < 32 and c not in "\n\r\t" for c in value):
+                        if _has_control_bytes(payload):
                             log.debug(
                                 "DMAP %s (%s): <binary data, %d bytes>",
                                 ascii_code,
@@ -433,6 +651,7 @@ class ShairportSyncPipeReader:
                                 len(payload),
                             )
                         else:
+                            value = payload.decode("utf-8").strip()
                             log.debug("DMAP %s (%s): %s", ascii_code, description, value)
                     except UnicodeDecodeError as e:
                         log.debug(
@@ -444,10 +663,11 @@ class ShairportSyncPipeReader:
                         )
                 else:
                     # Unknown DMAP field - show hex
+                    if not self._should_log_unknown_code(code):
+                        return
                     try:
-                        value = payload.decode("utf-8").strip()
                         # Check for binary data disguised as text
-                        if "\x00" in value or any(ord(c) < 32 and c not in "\n\r\t" for c in value):
+                        if _has_control_bytes(payload):
                             log.debug(
                                 "Unknown DMAP 0x%08x ('%s'): <binary data, %d bytes>",
                                 code,
@@ -455,6 +675,7 @@ class ShairportSyncPipeReader:
                                 len(payload),
                             )
                         else:
+                            value = payload.decode("utf-8").strip()
                             log.debug(
                                 "Unknown DMAP 0x%08x ('%s'): %s",
                                 code,
@@ -469,6 +690,8 @@ class ShairportSyncPipeReader:
                             len(payload),
                         )
             except (UnicodeDecodeError, struct.error):
+                if not self._should_log_unknown_code(code):
+                    return
                 try:
                     value = payload.decode("utf-8").strip()
                     log.debug("Unknown core metadata code: 0x%08x: %s", code, value)
@@ -479,6 +702,16 @@ class ShairportSyncPipeReader:
                         len(payload),
                     )
 
+    def _should_log_unknown_code(self, code: int) -> bool:
+        """Count an unknown code and report whether this occurrence should be logged.
+
+        Only the 1st, 2nd, 4th, 8th, ... occurrence of each code is logged so noisy
+        streams don't pay the formatting cost on every item.
+        """
+        count = self._unknown_code_counts[code] + 1
+        self._unknown_code_counts[code] = count
+        return not count & (count - 1)
+
     def _handle_ssnc_metadata(self, code: int, payload: bytes) -> None:
         """Handle shairport-sync specific metadata and state changes."""
         if code == 0x70637374:  # 'pcst' - Play/Control State
@@ -489,13 +722,13 @@ class ShairportSyncPipeReader:
             self._handle_metadata_end(payload)
         elif code == 0x70626567:  # 'pbeg' - Play Session Begin
             log.debug("Play session begin")
-            self._state_callback(PlaybackState.PLAYING)
+            self._dispatch_state(PlaybackState.PLAYING)
         elif code == 0x70656E64:  # 'pend' - Play Session End
             log.debug("Play session end")
-            self._state_callback(PlaybackState.STOPPED)
+            self._dispatch_state(PlaybackState.STOPPED)
         elif code == 0x7072736D:  # 'prsm' - Play Stream Resume
             log.debug("Play stream resume")
-            self._state_callback(PlaybackState.PLAYING)
+            self._dispatch_state(PlaybackState.PLAYING)
         elif code == 0x70666C73:  # 'pfls' - Play Stream Flush
             log.debug("Play stream flush")
             # Flush typically indicates buffering/waiting
@@ -507,22 +740,22 @@ class ShairportSyncPipeReader:
             # Connection end, typically before new session
         elif code == 0x50494354:  # 'PICT' - Picture Data
             self._handle_picture_data(payload)
-        elif code == 0x70726772:  # 'prgr' - Progress Information
-            self._handle_progress_info(payload)
-        elif code == 0x61637265:  # 'acre' - Active Remote Token
-            self._handle_active_remote_token(payload)
-        elif code == 0x64616964:  # 'daid' - DACP ID
-            self._handle_dacp_id(payload)
-        elif code == 0x636C6970:  # 'clip' - Client IP Address
-            self._handle_client_ip(payload)
-        elif code == 0x73766970:  # 'svip' - Server IP Address
-            self._handle_server_ip(payload)
+        elif code == 0x70726772:  # 'prgr' - Progress Information ("start/current/end" RTP timestamps)
+            self._log_simple("Progress info", payload)
+        elif code == 0x61637265:  # 'acre' - Active Remote token for remote control of the source
+            self._log_simple("Active Remote token", payload)
+        elif code == 0x64616964:  # 'daid' - DACP ID identifying the source for remote control
+            self._log_simple("DACP ID", payload)
+        elif code == 0x636C6970:  # 'clip' - IP address of the device sending audio
+            self._log_simple("Client IP", payload)
+        elif code == 0x73766970:  # 'svip' - IP address of this shairport-sync instance
+            self._log_simple("Server IP", payload)
         elif code == 0x61626567:  # 'abeg' - Enter Active State
             log.debug("Enter active state")
             # This indicates the player is becoming active/ready
         elif code == 0x61656E64:  # 'aend' - Exit Active State
             log.debug("Exit active state")
-            self._state_callback(PlaybackState.NO_SESSION)
+            self._dispatch_state(PlaybackState.NO_SESSION)
         else:
             # Convert code to 4-character string for logging
             code_str = struct.pack(">I", code).decode("ascii", errors="ignore")
@@ -530,25 +763,24 @@ class ShairportSyncPipeReader:
 
     def _handle_play_control_state(self, payload: bytes) -> None:
         """Handle play/control state changes."""
-        try:
-            # pcst payload is typically "0" or "1" as ASCII
-            state_str = payload.decode("ascii").strip()
-            if state_str == "1":
-                log.debug("Play control state: playing")
-                self._state_callback(PlaybackState.PLAYING)
-            elif state_str == "0":
-                log.debug("Play control state: paused")
-                self._state_callback(PlaybackState.PAUSED)
-            else:
-                log.debug("Unknown play control state: %s", state_str)
-        except UnicodeDecodeError:
-            log.warning("Failed to decode play control state payload")
+        # pcst payload is typically "0" or "1" as ASCII
+        # A malformed state message is worth surfacing, unlike the informational codes
+        state_str = self._decode_ascii_strip(payload, "play control state payload", logging.WARNING)
+        if state_str == "1":
+            log.debug("Play control state: playing")
+            self._dispatch_state(PlaybackState.PLAYING)
+        elif state_str == "0":
+            log.debug("Play control state: paused")
+            self._dispatch_state(PlaybackState.PAUSED)
+        elif state_str is not None:
+            log.debug("Unknown play control state: %s", state_str)
 
     def _handle_metadata_start(self, payload: bytes) -> None:
         """Handle start of metadata bundle."""
         log.debug("Metadata bundle start")
         self._metadata_bundle_active = True
         self._current_metadata.clear()
+        self._metadata_snapshot = None
 
         # Create new metadata ID and increment sequence number
         self._current_metadata_id = str(uuid.uuid4())
@@ -565,6 +797,7 @@ class ShairportSyncPipeReader:
                 rtp_timestamp = payload.decode("ascii").strip()
                 log.debug("Metadata RTP timestamp: %s", rtp_timestamp)
                 self._current_metadata["rtp_timestamp"] = rtp_timestamp
+                self._metadata_snapshot = None
             except UnicodeDecodeError:
                 pass
 
@@ -573,8 +806,7 @@ class ShairportSyncPipeReader:
         log.debug("Metadata bundle end")
         if self._metadata_bundle_active and self._current_metadata:
             # Dispatch the completed metadata
-            log.info("Dispatching metadata: %s", self._current_metadata)
-            self._metadata_callback(self._current_metadata.copy())
+            self._dispatch_metadata(self._snapshot(), "Dispatching metadata: %s")
 
         self._metadata_bundle_active = False
         # Don't clear current_metadata here - preserve it for cover art updates
@@ -587,50 +819,19 @@ class ShairportSyncPipeReader:
             except UnicodeDecodeError:
                 pass
 
-    def _handle_progress_info(self, payload: bytes) -> None:
-        """Handle progress information."""
+    def _decode_ascii_strip(self, payload: bytes, what: str, level: int = logging.DEBUG) -> Optional[str]:
+        """Decode an ASCII ssnc payload, returning None (logged at level) if it is not valid ASCII."""
         try:
-            progress_str = payload.decode("ascii").strip()
-            log.debug("Progress info: %s", progress_str)
-            # Progress format is typically "start/current/end" RTP timestamps
+            return payload.decode("ascii").strip()
         except UnicodeDecodeError:
-            log.debug("Failed to decode progress info payload")
+            log.log(level, "Failed to decode %s", what)
+            return None
 
-    def _handle_active_remote_token(self, payload: bytes) -> None:
-        """Handle Active Remote token for remote control."""
-        try:
-            token = payload.decode("ascii").strip()
-            log.debug("Active Remote token: %s", token)
-            # This token is used for remote control of the source
-        except UnicodeDecodeError:
-            log.debug("Failed to decode Active Remote token")
-
-    def _handle_dacp_id(self, payload: bytes) -> None:
-        """Handle DACP (Digital Audio Control Protocol) ID."""
-        try:
-            dacp_id = payload.decode("ascii").strip()
-            log.debug("DACP ID: %s", dacp_id)
-            # Used to identify the source for remote control
-        except UnicodeDecodeError:
-            log.debug("Failed to decode DACP ID")
-
-    def _handle_client_ip(self, payload: bytes) -> None:
-        """Handle client IP address."""
-        try:
-            client_ip = payload.decode("ascii").strip()
-            log.debug("Client IP: %s", client_ip)
-            # IP address of the device sending audio
-        except UnicodeDecodeError:
-            log.debug("Failed to decode client IP")
-
-    def _handle_server_ip(self, payload: bytes) -> None:
-        """Handle server IP address."""
-        try:
-            server_ip = payload.decode("ascii").strip()
-            log.debug("Server IP: %s", server_ip)
-            # IP address of this shairport-sync instance
-        except UnicodeDecodeError:
-            log.debug("Failed to decode server IP")
+    def _log_simple(self, what: str, payload: bytes) -> None:
+        """Log an informational ssnc payload (progress, tokens, IP addresses)."""
+        value = self._decode_ascii_strip(payload, what)
+        if value is not None:
+            log.debug("%s: %s", what, value)
 
     def _handle_picture_data(self, payload: bytes) -> None:
         """Handle album art/cover art picture data."""
@@ -656,7 +857,6 @@ class ShairportSyncPipeReader:
             file_extension = "heif"
 
         # Generate filename with checksum and album name
-        import os
         import re
 
         # Calculate checksum of the image data (truncated to 8 characters)
@@ -671,45 +871,74 @@ class ShairportSyncPipeReader:
 
         filename = f"/tmp/cover_{album_name}_{image_checksum}.{file_extension}"
 
-        # Check if file already exists with same checksum - avoid regenerating
-        if os.path.exists(filename):
-            log.debug("Cover art already exists: %s", filename)
-            # Only update cover art path in current metadata if we have a complete metadata bundle
-            if self._current_metadata and self._current_metadata_id:
-                # Increment sequence number for cover art update
-                self._sequence_number += 1
-                self._current_metadata["sequence_number"] = str(self._sequence_number)
-                self._current_metadata["cover_art_path"] = filename
-                log.info(
-                    "Dispatching metadata with existing cover art: %s",
-                    self._current_metadata,
-                )
-                self._metadata_callback(self._current_metadata.copy())
-            else:
-                log.debug("No current metadata to update with existing cover art path")
-            return
+        # Only update metadata if we have a complete bundle
+        on_written = None
+        write_key = None
+        if self._current_metadata and self._current_metadata_id:
+            on_written = self._attach_cover_art(filename)
+            # A newer image for the same bundle supersedes one still waiting to be written
+            write_key = self._current_metadata_id
+        else:
+            log.debug("No current metadata to update with cover art path")
 
-        try:
-            with open(filename, "wb") as f:
-                f.write(payload)
-            log.info("Cover art saved to: %s", filename)
-
-            # Only update metadata if we have a complete bundle
-            if self._current_metadata and self._current_metadata_id:
-                # Increment sequence number for cover art update
-                self._sequence_number += 1
-                self._current_metadata["sequence_number"] = str(self._sequence_number)
-                self._current_metadata["cover_art_path"] = filename
-                log.info("Dispatching metadata with cover art: %s", self._current_metadata)
-                self._metadata_callback(self._current_metadata.copy())
-            else:
-                log.debug("No current metadata to update with cover art path")
+        # The writer thread skips files that already exist with the same checksum and
+        # dispatches the metadata once the file is on disk
+        self._cover_art_writer.submit(filename, payload, on_written, key=write_key)
 
-        except Exception as e:
-            log.error("Failed to save cover art: %s", e)
+    def _snapshot(self) -> Mapping[str, str]:
+        """Return a read-only snapshot of the current metadata for callbacks.
+
+        The snapshot is shared by every dispatch until the metadata next changes, so
+        callbacks receive an immutable mapping rather than their own copy.
+        """
+        if self._metadata_snapshot is None:
+            self._metadata_snapshot = MappingProxyType(dict(self._current_metadata))
+        return self._metadata_snapshot
+
+    def _attach_cover_art(self, filename: str) -> Callable[[], None]:
+        """Add a cover art path to the current bundle and return its deferred dispatch.
+
+        The snapshot is taken here on the reader thread; the returned callable runs on
+        the writer thread once the file exists.
+        """
+        # Increment sequence number for cover art update
+        self._sequence_number += 1
+        self._current_metadata["sequence_number"] = str(self._sequence_number)
+        self._current_metadata["cover_art_path"] = filename
+        self._metadata_snapshot = None
+        return functools.partial(self._dispatch_cover_art, self._snapshot())
+
+    def _dispatch_cover_art(self, metadata: Mapping[str, str]) -> None:
+        """Dispatch a deferred cover art snapshot unless a newer bundle has started."""
+        with self._dispatch_lock:
+            if metadata.get("metadata_id") != self._current_metadata_id:
+                log.debug("Dropping cover art for superseded metadata %s", metadata.get("metadata_id"))
+                return
+            self._dispatch_locked(metadata, "Dispatching metadata with cover art: %s")
+
+    def _dispatch_state(self, state: PlaybackState) -> None:
+        """Hand a playback state change to the callback, serialized with metadata dispatches."""
+        with self._dispatch_lock:
+            self._state_callback(state)
+
+    def _dispatch_metadata(self, metadata: Mapping[str, str], message: str) -> None:
+        """Log and hand a metadata snapshot to the callback."""
+        with self._dispatch_lock:
+            self._dispatch_locked(metadata, message)
+
+    def _dispatch_locked(self, metadata: Mapping[str, str], message: str) -> None:
+        """Invoke the callback; the caller must hold _dispatch_lock."""
+        # Only copy the snapshot into a readable dict when the message will be emitted
+        if log.isEnabledFor(logging.INFO):
+            log.info(message, dict(metadata))
+        self._metadata_callback(metadata)
+
+    def flush_cover_art(self) -> None:
+        """Block until pending cover art writes have been saved and dispatched."""
+        self._cover_art_writer.flush()
 
     def _reset_item_state(self) -> None:
         """Reset the current item state to prepare for next item."""
         self._current_item = None
         self._collecting_data = False
-        self._data_buffer = ""
+        self._data_length = 0
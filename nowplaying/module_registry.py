@@ -5,6 +5,7 @@ Supports debug logging, enable/disable states, and future extensibility.
 """
 
 import logging
+import sys
 from typing import Dict, Set
 
 
@@ -16,6 +17,18 @@ class ModuleRegistry:
         self._modules: Dict[str, dict] = {}
         # Modules will be registered by their respective components
 
+        # Indices maintained by the mutators so filtered queries don't scan every module.
+        # They are insertion-ordered dicts kept in registration order, like _modules.
+        self._enabled_names: Dict[str, None] = {}
+        self._category_index: Dict[str, Dict[str, None]] = {}
+
+        # Derived views are rebuilt lazily when the version moves past the cached one
+        self._version = 0
+        self._cached_version = -1
+        self._cached_logger_names: Set[str] = set()
+        self._cached_debug_flags: Dict[str, str] = {}
+        self._cached_categories: Set[str] = set()
+
     def register_module(
         self,
         name: str,
@@ -26,6 +39,17 @@ class ModuleRegistry:
         category: str = "feature",
     ):
         """Register a new module with essential metadata."""
+        # Names, flags and categories are looked up repeatedly - keep one shared copy of each
+        name = sys.intern(name)
+        logger_name = sys.intern(logger_name)
+        debug_flag = sys.intern(debug_flag)
+        category = sys.intern(category)
+
+        previous = self._modules.get(name)
+        if previous is not None:
+            # Re-registration replaces the module - drop it from the old category
+            self._category_index[previous["category"]].pop(name, None)
+
         self._modules[name] = {
             "description": description,
             "logger_name": logger_name,
@@ -34,11 +58,19 @@ class ModuleRegistry:
             "enabled": enabled,
             "category": category,
         }
+        if enabled:
+            self._index_add(self._enabled_names, name)
+        else:
+            self._enabled_names.pop(name, None)
+        self._index_add(self._category_index.setdefault(category, {}), name)
+        self._version += 1
 
     def enable_module(self, name: str) -> bool:
         """Enable a module if it exists."""
         if name in self._modules:
             self._modules[name]["enabled"] = True
+            self._index_add(self._enabled_names, name)
+            self._version += 1
             return True
         return False
 
@@ -46,6 +78,8 @@ class ModuleRegistry:
         """Disable a module if it exists."""
         if name in self._modules:
             self._modules[name]["enabled"] = False
+            self._enabled_names.pop(name, None)
+            self._version += 1
             return True
         return False
 
@@ -55,11 +89,11 @@ class ModuleRegistry:
 
     def get_enabled_modules(self) -> Dict[str, dict]:
         """Get all enabled modules."""
-        return {name: info for name, info in self._modules.items() if info["enabled"]}
+        return {name: self._modules[name] for name in self._enabled_names}
 
     def get_modules_by_category(self, category: str) -> Dict[str, dict]:
         """Get all modules in a specific category."""
-        return {name: info for name, info in self._modules.items() if info["category"] == category}
+        return {name: self._modules[name] for name in self._category_index.get(category, ())}
 
     def get_all_modules(self) -> Dict[str, dict]:
         """Get all registered modules."""
@@ -70,20 +104,52 @@ class ModuleRegistry:
         return set(self._modules.keys())
 
     def get_debug_logger_names(self) -> Set[str]:
-        """Get all logger names for debug filtering."""
-        return {info["logger_name"] for info in self._modules.values()}
+        """Get all logger names for debug filtering.
+
+        The returned set is cached and shared between callers - do not mutate it.
+        """
+        self._refresh_cached_views()
+        return self._cached_logger_names
 
     def get_debug_flags(self) -> Dict[str, str]:
-        """Get mapping of debug CLI flags to module names."""
-        return {info["debug_flag"]: name for name, info in self._modules.items()}
+        """Get mapping of debug CLI flags to module names.
+
+        The returned dict is cached and shared between callers - do not mutate it.
+        """
+        self._refresh_cached_views()
+        return self._cached_debug_flags
 
     def get_module_info(self, name: str) -> dict:
         """Get information about a specific module."""
         return self._modules.get(name, {})
 
     def get_categories(self) -> Set[str]:
-        """Get all unique categories."""
-        return {info["category"] for info in self._modules.values()}
+        """Get all unique categories.
+
+        The returned set is cached and shared between callers - do not mutate it.
+        """
+        self._refresh_cached_views()
+        return self._cached_categories
+
+    def _index_add(self, index: Dict[str, None], name: str) -> None:
+        """Add a module name to an index, keeping the index in registration order."""
+        if name in index:
+            return
+        index[name] = None
+        if name != next(reversed(self._modules)):
+            # Re-enabled or re-registered module - reinsert in its registration position
+            ordered = [other for other in self._modules if other in index]
+            index.clear()
+            index.update(dict.fromkeys(ordered))
+
+    def _refresh_cached_views(self) -> None:
+        """Rebuild the derived logger/flag/category views if the registry changed."""
+        if self._cached_version == self._version:
+            return
+        self._cached_logger_names = {info["logger_name"] for info in self._modules.values()}
+        self._cached_debug_flags = {info["debug_flag"]: name for name, info in self._modules.items()}
+        self._cached_categories = {info["category"] for info in self._modules.values()}
+        self._cached_version = self._version
 
 
 # Global registry instance
@@ -5,34 +5,106 @@ Handles left-right swipe navigation between registered content panels,
 manages the hold/release functionality for exploration contexts.
 """
 
-from enum import Enum
-from typing import List, Optional, Tuple
+from enum import IntEnum
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import pygame
 
 from .music_views import ContentContext, ContentPanel, content_panel_registry
 
-
-class SwipeDirection(Enum):
+# Touch/finger event support is fixed for the lifetime of the process
+_HAS_FINGER = hasattr(pygame, "FINGERDOWN")
+_FINGERDOWN = getattr(pygame, "FINGERDOWN", None)
+_FINGERUP = getattr(pygame, "FINGERUP", None)
+
+# Input events the navigator or any panel may consume; handle_events skips the rest
+_INPUT_EVENT_TYPES = frozenset(
+    event_type
+    for event_type in (
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEWHEEL,
+        pygame.KEYDOWN,
+        pygame.VIDEORESIZE,
+        _FINGERDOWN,
+        _FINGERUP,
+        getattr(pygame, "FINGERMOTION", None),
+    )
+    if event_type is not None
+)
+
+
+class SwipeDirection(IntEnum):
     """Swipe direction enumeration."""
 
-    LEFT = "left"
-    RIGHT = "right"
-    NONE = "none"
+    LEFT = 0
+    RIGHT = 1
+    NONE = 2
+
+
+def _context_signature(context: ContentContext) -> Tuple:
+    """Return the context fields that affect which panels are available."""
+    return (
+        context.artist,
+        context.album,
+        bool(context.cover_art_path),
+        bool(context.audio_levels),
+    )
 
 
 class PanelNavigator:
     """Manages navigation between content panels with swipe support."""
 
+    # Fixed attribute layout - navigator state is read on every event and frame
+    __slots__ = (
+        "registry",
+        "_current_panel_index",
+        "_available_panels",
+        "_panel_index_by_id",
+        "_panel_info_cache",
+        "_panel_info_dirty",
+        "_panel_info_key",
+        "_swipe_start_pos",
+        "_swipe_threshold",
+        "_swipe_actions",
+        "_swipe_in_progress",
+        "_transition_offset",
+        "_transition_speed",
+        "_last_live_context",
+        "_last_context_signature",
+        "_hint_font",
+        "_hint_surfaces",
+        "_hint_state",
+        "_hint_lines",
+        "_registry_status",
+        "_registry_status_key",
+        "_cached_surface_size",
+        "_key_handlers",
+        "_event_handlers",
+    )
+
     def __init__(self):
         """Initialize the panel navigator."""
         self.registry = content_panel_registry
         self._current_panel_index = 0
         self._available_panels: List[ContentPanel] = []
+        self._panel_index_by_id: Dict[str, int] = {}
+
+        # get_panel_info() result, rebuilt after navigation or when the registry version changes
+        self._panel_info_cache: Optional[dict] = None
+        self._panel_info_dirty = True
+        self._panel_info_key: Tuple[int, int] = (0, -1)
 
         # Swipe detection
         self._swipe_start_pos: Optional[Tuple[int, int]] = None
         self._swipe_threshold = 50  # Minimum distance for swipe
+        # Gesture actions indexed by (is_horizontal << 1) | is_positive
+        self._swipe_actions: Tuple[Callable[[], bool], ...] = (
+            self._hold_current_context,  # Swipe up -> hold current context
+            self._release_held_context,  # Swipe down -> release held context
+            self.navigate_right,  # Swipe left -> go to next panel
+            self.navigate_left,  # Swipe right -> go to previous panel
+        )
         self._swipe_in_progress = False
 
         # Panel transition animation (optional)
@@ -41,13 +113,56 @@ class PanelNavigator:
 
         # Context management
         self._last_live_context: Optional[ContentContext] = None
+        self._last_context_signature: Optional[Tuple] = None
+
+        # Navigation hint rendering - the font is loaded lazily and the small set of
+        # hint strings is rasterized once
+        self._hint_font: Optional[pygame.font.Font] = None
+        self._hint_surfaces: Dict[str, pygame.Surface] = {}
+        # The indicator/hint surfaces for the current navigation state, rebuilt when it changes
+        self._hint_state: Optional[Tuple] = None
+        self._hint_lines: Tuple[pygame.Surface, pygame.Surface] = ()
+
+        # Registry status for get_navigation_status, keyed by registry identity and version
+        self._registry_status: Optional[dict] = None
+        self._registry_status_key: Tuple[int, int] = (0, -1)
+
+        # Display size used to scale normalized touch coordinates, refreshed on resize
+        self._cached_surface_size: Optional[Tuple[int, int]] = None
+
+        # Event dispatch tables, built once instead of walking a comparison chain per event
+        self._key_handlers: Dict[int, Callable[[], bool]] = {
+            pygame.K_LEFT: self.navigate_left,
+            pygame.K_a: self.navigate_left,
+            pygame.K_RIGHT: self.navigate_right,
+            pygame.K_d: self.navigate_right,
+            pygame.K_SPACE: self._toggle_hold_context,  # Toggle hold/release
+            pygame.K_h: self._hold_current_context,
+            pygame.K_r: self._release_held_context,
+        }
+        self._event_handlers: Dict[int, Callable[[pygame.event.Event], bool]] = {
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_down,
+            pygame.MOUSEBUTTONUP: self._on_mouse_up,
+            pygame.KEYDOWN: self._on_key_down,
+            pygame.VIDEORESIZE: self._on_video_resize,
+        }
+        # Touch/finger events (if supported)
+        if _HAS_FINGER:
+            self._event_handlers[_FINGERDOWN] = self._on_finger_down
+            self._event_handlers[_FINGERUP] = self._on_finger_up
 
     def update_available_panels(self, context: Optional[ContentContext] = None) -> None:
         """Update the list of available panels based on context."""
+        current_panel = self.get_current_panel()
         self._available_panels = self.registry.get_available_panels(context)
-
-        # Ensure current index is valid
-        if self._available_panels:
+        self._panel_index_by_id = {panel.info.id: i for i, panel in enumerate(self._available_panels)}
+        self._panel_info_dirty = True
+
+        # Stay on the same panel when it is still available, wherever it now sits
+        index = self._panel_index_by_id.get(current_panel.info.id) if current_panel else None
+        if index is not None:
+            self._current_panel_index = index
+        elif self._available_panels:
             self._current_panel_index = max(0, min(self._current_panel_index, len(self._available_panels) - 1))
         else:
             self._current_panel_index = 0
@@ -59,30 +174,41 @@ class PanelNavigator:
         return None
 
     def get_panel_info(self) -> dict:
-        """Get information about current panel state."""
-        current = self.get_current_panel()
-        return {
-            "current_index": self._current_panel_index,
-            "total_panels": len(self._available_panels),
-            "current_panel_id": current.info.id if current else None,
-            "current_panel_name": current.info.name if current else None,
-            "has_held_context": self.registry.has_held_context(),
-            "can_swipe_left": self._current_panel_index > 0,
-            "can_swipe_right": self._current_panel_index < len(self._available_panels) - 1,
-        }
+        """Get information about current panel state.
+
+        The returned dict is cached until navigation changes or the registry version moves
+        (e.g. a context held or released directly on the registry) - do not mutate it.
+        """
+        key = (id(self.registry), self.registry.version)
+        if self._panel_info_dirty or self._panel_info_cache is None or self._panel_info_key != key:
+            current = self.get_current_panel()
+            self._panel_info_cache = {
+                "current_index": self._current_panel_index,
+                "total_panels": len(self._available_panels),
+                "current_panel_id": current.info.id if current else None,
+                "current_panel_name": current.info.name if current else None,
+                "has_held_context": self.registry.has_held_context(),
+                "can_swipe_left": self._current_panel_index > 0,
+                "can_swipe_right": self._current_panel_index < len(self._available_panels) - 1,
+            }
+            self._panel_info_dirty = False
+            self._panel_info_key = key
+        return self._panel_info_cache
 
     def navigate_to_panel(self, panel_id: str) -> bool:
         """Navigate directly to a panel by ID."""
-        for i, panel in enumerate(self._available_panels):
-            if panel.info.id == panel_id:
-                self._current_panel_index = i
-                return True
-        return False
+        index = self._panel_index_by_id.get(panel_id)
+        if index is None:
+            return False
+        self._current_panel_index = index
+        self._panel_info_dirty = True
+        return True
 
     def navigate_left(self) -> bool:
         """Navigate to previous panel."""
         if self._current_panel_index > 0:
             self._current_panel_index -= 1
+            self._panel_info_dirty = True
             return True
         return False
 
@@ -90,6 +216,7 @@ class PanelNavigator:
         """Navigate to next panel."""
         if self._current_panel_index < len(self._available_panels) - 1:
             self._current_panel_index += 1
+            self._panel_info_dirty = True
             return True
         return False
 
@@ -101,56 +228,78 @@ class PanelNavigator:
             return True
 
         # Handle navigation events
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:  # Left mouse button
-                self._swipe_start_pos = event.pos
-                self._swipe_in_progress = True
-                return True
-
-        elif event.type == pygame.MOUSEBUTTONUP:
-            if event.button == 1 and self._swipe_in_progress:
-                self._handle_swipe_end(event.pos)
-                self._swipe_start_pos = None
-                self._swipe_in_progress = False
-                return True
-
-        elif event.type == pygame.KEYDOWN:
-            # Keyboard navigation
-            if event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                return self.navigate_left()
-            elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                return self.navigate_right()
-            elif event.key == pygame.K_SPACE:
-                # Toggle hold/release
-                return self._toggle_hold_context()
-            elif event.key == pygame.K_h:
-                # Hold current context
-                return self._hold_current_context()
-            elif event.key == pygame.K_r:
-                # Release held context
-                return self._release_held_context()
-
-        # Touch/finger events (if supported)
-        elif hasattr(pygame, "FINGERDOWN") and event.type == pygame.FINGERDOWN:
-            self._swipe_start_pos = (
-                event.x * pygame.display.get_surface().get_width(),
-                event.y * pygame.display.get_surface().get_height(),
-            )
+        handler = self._event_handlers.get(event.type)
+        return handler(event) if handler else False
+
+    def handle_events(self, events: Iterable[pygame.event.Event]) -> None:
+        """Handle a batch of events, e.g. everything returned by one pygame.event.get().
+
+        Fetch events in batches rather than polling them one at a time; event types
+        that neither the navigator nor the panels handle are skipped without dispatch.
+        """
+        handle_event = self.handle_event
+        for event in events:
+            if event.type in _INPUT_EVENT_TYPES:
+                handle_event(event)
+
+    def _on_mouse_down(self, event: pygame.event.Event) -> bool:
+        """Start a swipe on left mouse button press."""
+        if event.button == 1:  # Left mouse button
+            self._swipe_start_pos = event.pos
             self._swipe_in_progress = True
             return True
+        return False
 
-        elif hasattr(pygame, "FINGERUP") and event.type == pygame.FINGERUP and self._swipe_in_progress:
-            end_pos = (
-                event.x * pygame.display.get_surface().get_width(),
-                event.y * pygame.display.get_surface().get_height(),
-            )
-            self._handle_swipe_end(end_pos)
+    def _on_mouse_up(self, event: pygame.event.Event) -> bool:
+        """Finish a swipe on left mouse button release."""
+        if event.button == 1 and self._swipe_in_progress:
+            self._handle_swipe_end(event.pos)
             self._swipe_start_pos = None
             self._swipe_in_progress = False
             return True
+        return False
 
+    def _on_key_down(self, event: pygame.event.Event) -> bool:
+        """Handle keyboard navigation."""
+        handler = self._key_handlers.get(event.key)
+        return handler() if handler else False
+
+    def _on_video_resize(self, event: pygame.event.Event) -> bool:
+        """Forget the cached display size; the resize itself is handled elsewhere."""
+        self._cached_surface_size = None
         return False
 
+    def set_display_size(self, width: int, height: int) -> None:
+        """Set the display size used to scale touch coordinates.
+
+        Call after every display mode change; set_mode() does not emit VIDEORESIZE.
+        """
+        self._cached_surface_size = (width, height)
+
+    def _surface_size(self) -> Tuple[int, int]:
+        """Get the display size used to scale touch coordinates."""
+        if self._cached_surface_size is None:
+            self._cached_surface_size = pygame.display.get_surface().get_size()
+        return self._cached_surface_size
+
+    def _on_finger_down(self, event: pygame.event.Event) -> bool:
+        """Start a swipe on touch."""
+        width, height = self._surface_size()
+        self._swipe_start_pos = (event.x * width, event.y * height)
+        self._swipe_in_progress = True
+        return True
+
+    def _on_finger_up(self, event: pygame.event.Event) -> bool:
+        """Finish a swipe when the touch is lifted."""
+        if not self._swipe_in_progress:
+            return False
+        width, height = self._surface_size()
+        end_pos = (event.x * width, event.y * height)
+        self._handle_swipe_end(end_pos)
+        self._swipe_start_pos = None
+        self._swipe_in_progress = False
+        return True
+
     def _handle_swipe_end(self, end_pos: Tuple[int, int]) -> None:
         """Handle end of swipe gesture."""
         if not self._swipe_start_pos:
@@ -159,23 +308,16 @@ class PanelNavigator:
         dx = end_pos[0] - self._swipe_start_pos[0]
         dy = end_pos[1] - self._swipe_start_pos[1]
 
-        # Check if it's a horizontal swipe
-        if abs(dx) > abs(dy) and abs(dx) > self._swipe_threshold:
-            if dx > 0:
-                # Swipe right -> go to previous panel
-                self.navigate_left()
-            else:
-                # Swipe left -> go to next panel
-                self.navigate_right()
-
-        # Check for vertical swipe (hold/release gesture)
-        elif abs(dy) > abs(dx) and abs(dy) > self._swipe_threshold:
-            if dy < 0:
-                # Swipe up -> hold current context
-                self._hold_current_context()
-            else:
-                # Swipe down -> release held context
-                self._release_held_context()
+        ax, ay = abs(dx), abs(dy)
+        if ax == ay:
+            return  # Diagonal gestures are ambiguous
+
+        horiz = ax > ay
+        if (ax if horiz else ay) <= self._swipe_threshold:
+            return
+
+        # Index by (axis, sign) into the gesture table built in __init__
+        self._swipe_actions[(horiz << 1) | ((dx if horiz else dy) > 0)]()
 
     def _toggle_hold_context(self) -> bool:
         """Toggle between held and live context."""
@@ -189,6 +331,7 @@ class PanelNavigator:
         live_context = self.registry.get_live_context()
         if live_context and not self.registry.has_held_context():
             self.registry.set_held_context(live_context)
+            self._panel_info_dirty = True
             return True
         return False
 
@@ -196,6 +339,7 @@ class PanelNavigator:
         """Release held context and return to live updates."""
         if self.registry.has_held_context():
             self.registry.release_held_context()
+            self._panel_info_dirty = True
             return True
         return False
 
@@ -211,54 +355,83 @@ class PanelNavigator:
 
     def _context_changed_significantly(self, new_context: ContentContext) -> bool:
         """Check if context changed enough to refresh panel availability."""
-        if not self._last_live_context:
-            return True
-
-        # Check key fields that might affect panel availability
-        return (
-            self._last_live_context.artist != new_context.artist
-            or self._last_live_context.album != new_context.album
-            or bool(self._last_live_context.cover_art_path) != bool(new_context.cover_art_path)
-            or bool(self._last_live_context.audio_levels) != bool(new_context.audio_levels)
-        )
+        signature = _context_signature(new_context)
+        if signature == self._last_context_signature:
+            return False
+        self._last_context_signature = signature
+        return True
+
+    def _render_hint(self, text: str) -> pygame.Surface:
+        """Render a navigation hint string, reusing a cached surface when possible."""
+        hint_surface = self._hint_surfaces.get(text)
+        if hint_surface is None:
+            if self._hint_font is None:
+                self._hint_font = pygame.font.Font(None, 16)
+            hint_color = (140, 140, 140)
+            hint_surface = self._hint_font.render(text, True, hint_color)
+            if len(self._hint_surfaces) >= 32:
+                self._hint_surfaces.clear()  # Panels were renamed/reordered many times; start over
+            self._hint_surfaces[text] = hint_surface
+        return hint_surface
 
     def render_navigation_hints(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
         """Render navigation hints/indicators."""
-        font = pygame.font.Font(None, 16)
-        hint_color = (140, 140, 140)
+        current = self.get_current_panel()
+        if not current:
+            return
 
-        # Panel indicator
+        # Strings depend only on this state, so formatting is skipped on unchanged frames
         panel_info = self.get_panel_info()
-        current = self.get_current_panel()
+        held = self.registry.has_held_context()
+        state = (
+            current.info.name,
+            panel_info["current_index"],
+            panel_info["total_panels"],
+            panel_info["can_swipe_left"],
+            panel_info["can_swipe_right"],
+            held,
+        )
+        if state != self._hint_state:
+            self._hint_lines = self._build_hint_lines(state)
+            self._hint_state = state
+
+        panel_line, hint_line = self._hint_lines
+        surface.blit(panel_line, (rect.x + 10, rect.bottom - 40))
+        surface.blit(hint_line, (rect.x + 10, rect.bottom - 20))
+
+    def _build_hint_lines(self, state: Tuple) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Render the panel indicator and hint line for a navigation state."""
+        name, index, total, can_swipe_left, can_swipe_right, held = state
+
+        # Panel name and position
+        panel_text = f"{name} ({index + 1}/{total})"
+
+        # Navigation hints
+        hints = []
+        if can_swipe_left:
+            hints.append("← Prev")
+        if can_swipe_right:
+            hints.append("Next →")
+
+        if held:
+            hints.append("Space: Release")
+        else:
+            hints.append("Space: Hold")
 
-        if current:
-            # Panel name and position
-            panel_text = f"{current.info.name} ({panel_info['current_index'] + 1}/{panel_info['total_panels']})"
-            panel_surface = font.render(panel_text, True, hint_color)
-            surface.blit(panel_surface, (rect.x + 10, rect.bottom - 40))
-
-            # Navigation hints
-            hints = []
-            if panel_info["can_swipe_left"]:
-                hints.append("← Prev")
-            if panel_info["can_swipe_right"]:
-                hints.append("Next →")
-
-            if self.registry.has_held_context():
-                hints.append("Space: Release")
-            else:
-                hints.append("Space: Hold")
-
-            if hints:
-                hint_text = " | ".join(hints)
-                hint_surface = font.render(hint_text, True, hint_color)
-                surface.blit(hint_surface, (rect.x + 10, rect.bottom - 20))
+        return self._render_hint(panel_text), self._render_hint(" | ".join(hints))
 
     def get_navigation_status(self) -> dict:
-        """Get detailed navigation status for debugging."""
+        """Get detailed navigation status for debugging.
+
+        The registry status is reused until the registry version changes.
+        """
+        key = (id(self.registry), self.registry.version)
+        if self._registry_status is None or self._registry_status_key != key:
+            self._registry_status = self.registry.get_registry_status()
+            self._registry_status_key = key
         return {
             **self.get_panel_info(),
-            "registry_status": self.registry.get_registry_status(),
+            "registry_status": self._registry_status,
             "swipe_in_progress": self._swipe_in_progress,
             "transition_offset": self._transition_offset,
         }
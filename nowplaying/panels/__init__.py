@@ -3,25 +3,51 @@ Content panels package for the music discovery interface.
 
 This package provides the base classes and built-in panel implementations
 for the swipeable content interface.
+
+Built-in panels are imported on first access, so importing the package (e.g.
+for the base classes or the registry) doesn't load every panel module.
 """
 
-from .album_enrichment_panel import AlbumEnrichmentPanel
-from .album_info_panel import AlbumInfoPanel
-from .artist_enrichment_panel import ArtistEnrichmentPanel
-from .artist_info_panel import ArtistInfoPanel
+import importlib
+from typing import Any, List
+
 from .base import ContentContext, ContentPanel, ContentPanelRegistry, PanelInfo  # Base classes
-from .cover_art_panel import CoverArtPanel
-from .debug_panel import DebugPanel
-from .discography_panel import DiscographyPanel
-from .discogs_panel import DiscogsPanel
-from .lastfm_panel import LastFmPanel
-from .musicbrainz_panel import MusicBrainzPanel
-from .now_playing_panel import NowPlayingPanel
 from .registry import content_panel_registry
-from .service_status_panel import ServiceStatusPanel
-from .social_stats_panel import SocialStatsPanel
-from .song_enrichment_panel import SongEnrichmentPanel
-from .vu_meter_panel import VUMeterPanel
+
+# Built-in panel class name -> defining module, imported lazily by __getattr__
+_LAZY_PANELS = {
+    "AlbumEnrichmentPanel": "album_enrichment_panel",
+    "AlbumInfoPanel": "album_info_panel",
+    "ArtistEnrichmentPanel": "artist_enrichment_panel",
+    "ArtistInfoPanel": "artist_info_panel",
+    "CoverArtPanel": "cover_art_panel",
+    "DebugPanel": "debug_panel",
+    "DiscographyPanel": "discography_panel",
+    "DiscogsPanel": "discogs_panel",
+    "LastFmPanel": "lastfm_panel",
+    "MusicBrainzPanel": "musicbrainz_panel",
+    "NowPlayingPanel": "now_playing_panel",
+    "ServiceStatusPanel": "service_status_panel",
+    "SocialStatsPanel": "social_stats_panel",
+    "SongEnrichmentPanel": "song_enrichment_panel",
+    "VUMeterPanel": "vu_meter_panel",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a built-in panel class the first time it is accessed."""
+    module_name = _LAZY_PANELS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including panels that are not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_PANELS))
+
 
 __all__ = [
     # Base classes
@@ -5,17 +5,24 @@ This module provides the core abstractions for swipeable content panels:
 - ContentContext: Data class for content context
 - PanelInfo: Metadata about a panel
 - ContentPanel: Base interface for panel implementations
+- SectionSpec / SectionedContentPanel: Table-driven rendering of enrichment sections
+- EnrichmentLogPanel: Enrichment fields beside a service's captured log output
 - ContentPanelRegistry: Registry for managing available panels
+- wrap_text: Word wrapping shared by the text-heavy panels
 """
 
+import functools
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, fields, replace
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 import pygame
 
 from ..playback_state import PlaybackState
+from .enrichment_log_buffer import EnrichmentLogBuffer
 
 
 @dataclass
@@ -58,57 +65,53 @@ class ContentContext:
     enrichment_data: Optional[Dict[str, Any]] = None
 
     @classmethod
-    def from_metadata(cls, metadata: dict, state: PlaybackState, is_live: bool = True) -> "ContentContext":
+    def from_metadata(cls, metadata: Mapping[str, str], state: PlaybackState, is_live: bool = True) -> "ContentContext":
         """Create context from metadata dict and state."""
         return cls(
-            artist=metadata.get("artist", ""),
-            album=metadata.get("album", ""),
-            title=metadata.get("title", ""),
-            genre=metadata.get("genre", ""),
-            cover_art_path=metadata.get("cover_art_path"),
             playback_state=state,
-            year=metadata.get("year"),
-            track_number=metadata.get("track_number"),
-            track_id=metadata.get("track_id"),
-            album_artist=metadata.get("album_artist"),
-            composer=metadata.get("composer"),
-            duration=metadata.get("duration"),
-            bitrate=metadata.get("bitrate"),
-            format=metadata.get("format"),
-            audio_levels=metadata.get("audio_levels"),
-            is_held=False,
             source="live" if is_live else "manual",
-            artist_id=metadata.get("artist_id"),
-            album_id=metadata.get("album_id"),
-            enrichment_data=metadata.get("enrichment_data"),
+            **{name: metadata[name] for name in _METADATA_FIELDS if name in metadata},
         )
 
     def hold(self) -> "ContentContext":
         """Create a held copy of this context for exploration."""
-        held_copy = ContentContext(
-            artist=self.artist,
-            album=self.album,
-            title=self.title,
-            genre=self.genre,
-            cover_art_path=self.cover_art_path,
-            playback_state=self.playback_state,
-            year=self.year,
-            track_number=self.track_number,
-            track_id=self.track_id,
-            album_artist=self.album_artist,
-            composer=self.composer,
-            duration=self.duration,
-            bitrate=self.bitrate,
-            format=self.format,
-            audio_levels=self.audio_levels,
-            is_held=True,
-            held_timestamp=datetime.now(),
-            source="held",
-            artist_id=self.artist_id,
-            album_id=self.album_id,
-            enrichment_data=self.enrichment_data,
-        )
-        return held_copy
+        return replace(self, is_held=True, held_timestamp=datetime.now(), source="held")
+
+
+# ContentContext fields that from_metadata copies straight from a metadata dict
+_METADATA_FIELDS = tuple(
+    field.name
+    for field in fields(ContentContext)
+    if field.name not in ("playback_state", "is_held", "held_timestamp", "source")
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def wrap_text(text: str, max_chars: int) -> Tuple[str, ...]:
+    """Wrap text into lines of at most max_chars, breaking only between words.
+
+    Words longer than max_chars get a line of their own. Line lengths are tracked
+    as integers and each line is joined once, so no intermediate strings are built.
+    Results are memoized, as the same bios and tag lists are wrapped by several
+    panels and again whenever a context is revisited; the lines are returned as
+    a tuple so the cached value cannot be modified by a caller.
+    """
+    lines: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for word in text.split():
+        word_len = len(word)
+        if current and current_len + 1 + word_len <= max_chars:
+            current.append(word)
+            current_len += 1 + word_len
+        else:
+            if current:
+                lines.append(" ".join(current))
+            current = [word]
+            current_len = word_len
+    if current:
+        lines.append(" ".join(current))
+    return tuple(lines)
 
 
 @dataclass
@@ -130,10 +133,18 @@ class PanelInfo:
 class ContentPanel(ABC):
     """Base interface for swipeable content panels."""
 
+    # Subclasses that declare their own __slots__ keep instances free of a __dict__
+    __slots__ = ("panel_info", "_context", "_font_cache", "_text_cache")
+
+    # Rendered text surfaces kept per panel by _render_text
+    TEXT_CACHE_SIZE = 256
+
     def __init__(self, panel_info: PanelInfo):
         """Initialize content panel with panel info."""
         self.panel_info = panel_info
         self._context: Optional[ContentContext] = None
+        self._font_cache: Dict[int, pygame.font.Font] = {}
+        self._text_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
 
     @property
     def info(self) -> PanelInfo:
@@ -190,16 +201,258 @@ class ContentPanel(ABC):
         # Most panels benefit, but some (like VU meters) work better with live data
         return not self.info.requires_audio_data
 
+    @staticmethod
+    def _is_clipped_out(surface: pygame.Surface, rect: pygame.Rect) -> bool:
+        """Return True if none of rect lies inside the surface's clip area, so drawing can be skipped."""
+        return not surface.get_clip().clip(rect)
+
+    def _get_font(self, size: int) -> pygame.font.Font:
+        """Get the default font at the given size, created on first use and reused across renders."""
+        font = self._font_cache.get(size)
+        if font is None:
+            font = self._font_cache[size] = pygame.font.Font(None, size)
+        return font
+
+    def _render_text(self, text: str, size: int, color: tuple) -> pygame.Surface:
+        """Render antialiased text, reusing the surface from an earlier identical render.
+
+        Labels and values rarely change between frames, so most renders are a cache hit.
+        Once a display mode is set, new surfaces are converted to the display's pixel
+        format so later blits need no per-pixel conversion.
+        The least recently used surfaces are dropped beyond TEXT_CACHE_SIZE.
+        """
+        key = (text, size, color)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is None:
+            surface = self._get_font(size).render(text, True, color)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            cache[key] = surface
+            if len(cache) > self.TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surface
+
+    def _truncate_to_width(self, text: str, size: int, max_width: int) -> str:
+        """Shorten text with a trailing "..." so it renders no wider than max_width pixels.
+
+        Text that would fit even if every character were as wide as "M" is returned
+        without measuring it; otherwise the longest fitting prefix is binary searched.
+        """
+        font = self._get_font(size)
+        if len(text) * font.size("M")[0] <= max_width * 0.9 or font.size(text)[0] <= max_width:
+            return text
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if font.size(text[:mid] + "...")[0] <= max_width:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low] + "..."
+
+
+# A formatted section line: plain text in the section's style, or (text, color, indent, line height)
+SectionLine = Union[str, Tuple[str, tuple, int, int]]
+
+
+def _format_value(value: Any) -> Iterable[SectionLine]:
+    """Show a scalar enrichment value as a single line."""
+    return (str(value),)
+
+
+@dataclass(frozen=True)
+class SectionSpec:
+    """One titled section of a SectionedContentPanel, drawn from an enrichment value."""
+
+    key: Optional[str]  # Enrichment key; None passes the whole enrichment dict to the formatter
+    title: str
+    color: tuple  # Color of plain-text lines
+    limit: Optional[int] = None  # Only the first `limit` items of a list value are passed on, as an iterator
+    formatter: Callable[[Any], Iterable[SectionLine]] = _format_value
+    gap: int = 10  # Extra space after the section
+
+
+class SectionedContentPanel(ContentPanel):
+    """Content panel that lays out its enrichment data from a table of SectionSpecs.
+
+    Subclasses only declare TITLE, NO_DATA_TEXT and SECTIONS. The positioned text is
+    built once and redrawn with a single Surface.blits call until the context, its
+    enrichment data or the panel origin changes.
+    """
+
+    __slots__ = ("_layout", "_layout_enrichment", "_layout_origin")
+
+    TITLE = ""
+    NO_DATA_TEXT = ""
+    SECTIONS: Tuple[SectionSpec, ...] = ()
+
+    def __init__(self, panel_info: PanelInfo):
+        """Initialize sectioned panel with panel info."""
+        super().__init__(panel_info)
+        self._layout: Optional[List[Tuple[pygame.Surface, Tuple[int, int]]]] = None
+        self._layout_enrichment: Optional[dict] = None
+        self._layout_origin: Optional[Tuple[int, int]] = None
+
+    def update_context(self, context: ContentContext) -> None:
+        """Update panel with new context."""
+        self._context = context
+        self._layout = None
+
+    def render(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """Render panel content."""
+        if not self._context or self._is_clipped_out(surface, rect):
+            return
+
+        # Enrichment data is attached to the context after it arrives, so watch it as well
+        enrichment = self._context.enrichment_data
+        origin = (rect.left, rect.top)
+        if self._layout is None or enrichment is not self._layout_enrichment or origin != self._layout_origin:
+            self._layout = self._build_layout(enrichment, *origin)
+            self._layout_enrichment = enrichment
+            self._layout_origin = origin
+
+        surface.blits(self._layout, doreturn=False)
+
+    def _build_layout(
+        self, enrichment: Optional[dict], left: int, top: int
+    ) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Render the title and each non-empty section, ready for a single Surface.blits call."""
+        blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        append = blits.append
+        render_text = self._render_text
+        title_x = left + 20
+        line_x = left + 30
+        y = top + 10
+
+        append((render_text(self.TITLE, 20, (120, 170, 255)), (title_x, y)))
+        y += 35
+
+        if not enrichment:
+            append((render_text(self.NO_DATA_TEXT, 20, (150, 150, 150)), (title_x, y)))
+            return blits
+
+        for spec in self.SECTIONS:
+            if spec.key is None:
+                lines = list(spec.formatter(enrichment))
+                if not lines:
+                    continue
+            else:
+                value = enrichment.get(spec.key)
+                if not value:
+                    continue
+                if spec.limit is not None:
+                    value = islice(value, spec.limit)
+                lines = spec.formatter(value)
+
+            append((render_text(spec.title, 16, (230, 230, 230)), (title_x, y)))
+            y += 20
+            for line in lines:
+                if isinstance(line, str):
+                    append((render_text(line, 16, spec.color), (line_x, y)))
+                    y += 18
+                else:
+                    text, color, indent, height = line
+                    append((render_text(text, 16, color), (left + indent, y)))
+                    y += height
+            y += spec.gap
+
+        return blits
+
+
+class EnrichmentLogPanel(ContentPanel):
+    """Panel showing one service's enrichment fields (left) and its recent log lines (right).
+
+    Subclasses set LOGGER_NAME and implement _field_lines. The blit sequence is
+    rebuilt only when the context, its enrichment data, the panel rect or the log
+    buffer changes; other frames redraw it with a single Surface.blits call.
+    """
+
+    LOGGER_NAME = ""
+    LOG_LINES = 15  # Most recent log lines shown
+
+    def __init__(self, panel_info: PanelInfo):
+        """Initialize the panel and start capturing the service's log output."""
+        super().__init__(panel_info)
+        self.log_buffer = EnrichmentLogBuffer(self.LOGGER_NAME)
+        self._blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._dirty = True
+        self._last_rect: Optional[Tuple[int, int, int, int]] = None
+        self._last_enrichment: Optional[Any] = None
+        self._last_log_revision = -1
+
+    def update_context(self, context: ContentContext) -> None:
+        """Update panel context."""
+        self._context = context
+        self._dirty = True
+
+    def render(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """Render panel content."""
+        if not self._context or self._is_clipped_out(surface, rect):
+            return
+
+        rect_key = (rect.left, rect.top, rect.width, rect.height)
+        enrichment = self._context.enrichment_data
+        log_revision = self.log_buffer.revision
+        if (
+            self._dirty
+            or rect_key != self._last_rect
+            or enrichment is not self._last_enrichment
+            or log_revision != self._last_log_revision
+        ):
+            self._blits = self._build_blits(rect)
+            self._dirty = False
+            self._last_rect = rect_key
+            self._last_enrichment = enrichment
+            self._last_log_revision = log_revision
+
+        surface.blits(self._blits, doreturn=False)
+
+    @abstractmethod
+    def _field_lines(self, enrichment: Any) -> List[str]:
+        """Return the left-column lines for the context's enrichment data (which may be None)."""
+
+    def _build_blits(self, rect: pygame.Rect) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Lay out the enrichment fields and the recent log lines."""
+        mid_x = rect.left + rect.width // 2
+        # Long values (bios, discographies) are cut to their column instead of rendering off-panel
+        field_width = rect.width // 2 - 30
+        log_width = rect.width - rect.width // 2 - 30
+        y = rect.top + 10
+        blits = []
+        for line in self._field_lines(self._context.enrichment_data):
+            line = self._truncate_to_width(line, 24, field_width)
+            blits.append((self._render_text(line, 24, (230, 230, 230)), (rect.left + 20, y)))
+            y += 30
+        y_log = rect.top + 10
+        for line in self.log_buffer.get_tail(self.LOG_LINES):
+            line = self._truncate_to_width(line, 24, log_width)
+            blits.append((self._render_text(line, 24, (180, 180, 180)), (mid_x + 20, y_log)))
+            y_log += 24
+        return blits
+
 
 class ContentPanelRegistry:
     """Registry for managing available content panels with dual-context support."""
 
     def __init__(self):
         """Initialize content panel registry."""
+        # Kept in registration order (dicts preserve insertion order)
         self._panels: Dict[str, ContentPanel] = {}
-        self._panel_order: List[str] = []
+        # Panels split by supports_hold(), sorted once at registration for context updates
+        self._holdable_panels: Dict[str, ContentPanel] = {}
+        self._live_only_panels: Dict[str, ContentPanel] = {}
         self._live_context: Optional[ContentContext] = None
         self._held_context: Optional[ContentContext] = None
+        # Bumped whenever panels or contexts change, so callers can cache derived state
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever panels are (un)registered or a context changes."""
+        return self._version
 
     def register_panel(self, panel: ContentPanel) -> None:
         """Register a new content panel."""
@@ -208,13 +461,19 @@ class ContentPanelRegistry:
             raise ValueError(f"Panel with id '{panel_id}' already registered")
 
         self._panels[panel_id] = panel
-        self._panel_order.append(panel_id)
+        if panel.supports_hold():
+            self._holdable_panels[panel_id] = panel
+        else:
+            self._live_only_panels[panel_id] = panel
+        self._version += 1
 
     def unregister_panel(self, panel_id: str) -> bool:
         """Unregister a panel by id."""
         if panel_id in self._panels:
             del self._panels[panel_id]
-            self._panel_order.remove(panel_id)
+            self._holdable_panels.pop(panel_id, None)
+            self._live_only_panels.pop(panel_id, None)
+            self._version += 1
             return True
         return False
 
@@ -224,16 +483,14 @@ class ContentPanelRegistry:
 
     def get_available_panels(self, context: Optional[ContentContext] = None) -> List[ContentPanel]:
         """Get all available panels, optionally filtered by context compatibility."""
-        panels = [self._panels[panel_id] for panel_id in self._panel_order if panel_id in self._panels]
-
         if context:
-            return [panel for panel in panels if panel.info.enabled and panel.can_display(context)]
+            return [panel for panel in self._panels.values() if panel.info.enabled and panel.can_display(context)]
 
-        return [panel for panel in panels if panel.info.enabled]
+        return [panel for panel in self._panels.values() if panel.info.enabled]
 
     def get_panel_ids(self) -> List[str]:
         """Get ordered list of panel ids."""
-        return self._panel_order.copy()
+        return list(self._panels)
 
     def get_panels_by_category(self, category: str) -> List[ContentPanel]:
         """Get all panels in a specific category."""
@@ -244,24 +501,27 @@ class ContentPanelRegistry:
     def update_live_context(self, context: ContentContext) -> None:
         """Update the live context (what's currently playing)."""
         self._live_context = context
+        self._version += 1
 
         # Update panels that prefer live data or don't have held context
-        for panel in self._panels.values():
-            if not panel.supports_hold() or self._held_context is None:
-                panel.update_context(context)
+        panels = self._panels if self._held_context is None else self._live_only_panels
+        for panel in panels.values():
+            panel.update_context(context)
 
     def set_held_context(self, context: ContentContext) -> None:
         """Set the held context for exploration."""
         self._held_context = context.hold()
+        self._version += 1
 
         # Update panels that support holding with the held context
-        for panel in self._panels.values():
-            if panel.supports_hold():
-                panel.update_context(self._held_context)
+        held_context = self._held_context
+        for panel in self._holdable_panels.values():
+            panel.update_context(held_context)
 
     def release_held_context(self) -> None:
         """Release held context and return to live updates."""
         self._held_context = None
+        self._version += 1
 
         # Update all panels with live context
         if self._live_context:
@@ -285,7 +545,7 @@ class ContentPanelRegistry:
         return {
             "total_panels": len(self._panels),
             "enabled_panels": len([p for p in self._panels.values() if p.info.enabled]),
-            "panel_order": self._panel_order.copy(),
+            "panel_order": list(self._panels),
             "categories": {p.info.category for p in self._panels.values()},
             "has_live_context": self._live_context is not None,
             "has_held_context": self._held_context is not None,
@@ -5,17 +5,24 @@ This panel displays album cover art in a large format for better viewing.
 It includes image loading, scaling, and caching functionality.
 """
 
-import contextlib
+import logging
 import os
+import threading
+from typing import Dict, Optional, Set, Tuple
 
 import pygame
 
 from .base import ContentContext, ContentPanel, PanelInfo
 
+log = logging.getLogger("cover_art_panel")
+
 
 class CoverArtPanel(ContentPanel):
     """Large cover art display panel."""
 
+    # Scaled covers kept per panel size, so a resize back to a recent size doesn't rescale
+    MAX_SCALED_COVERS = 4
+
     def __init__(self):
         """Initialize cover art panel."""
         info = PanelInfo(
@@ -27,47 +34,90 @@ class CoverArtPanel(ContentPanel):
             requires_cover_art=True,
         )
         super().__init__(info)
-        self._cover_surface = None
-        self._cached_path = None
+        self._cover_image: Optional[pygame.Surface] = None  # Decoded once per cover path
+        self._scaled_covers: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._cached_path: Optional[str] = None
+        self._cover_path_exists = False  # Checked once per context instead of on every frame
+        self._decoded_current: Optional[pygame.Surface] = None  # Worker result for _cached_path
+        self._decoding: Set[str] = set()  # Paths a worker thread is still decoding
+        # Guards _cached_path, _decoded_current and _decoding, which worker threads read and update
+        self._decode_lock = threading.Lock()
 
     def update_context(self, context: ContentContext) -> None:
         """Update with new content context."""
         self._context = context
+        # Checked once per context update rather than on every frame
+        self._cover_path_exists = bool(context.cover_art_path and os.path.isfile(context.cover_art_path))
         # Clear cache if cover path changed
         if context.cover_art_path != self._cached_path:
-            self._cover_surface = None
-            self._cached_path = context.cover_art_path
+            self._cover_image = None
+            self._scaled_covers.clear()
+            with self._decode_lock:
+                self._cached_path = context.cover_art_path
+                self._decoded_current = None
+        if self._cover_path_exists and self._cover_image is None:
+            # Also covers a file that appeared or was replaced after an earlier update or
+            # failed decode; render shows a placeholder until the worker has decoded it
+            self._start_decode(context.cover_art_path)
+
+    def _start_decode(self, path: str) -> Optional[threading.Thread]:
+        """Start a worker thread decoding the cover at path, unless it is decoded or in flight."""
+        with self._decode_lock:
+            if path in self._decoding:
+                return None
+            if path == self._cached_path and self._decoded_current is not None:
+                return None
+            self._decoding.add(path)
+        thread = threading.Thread(target=self._decode_cover, args=(path,), name="cover-art-decode", daemon=True)
+        thread.start()
+        return thread
+
+    def _decode_cover(self, path: str) -> None:
+        """Load a cover image file for the current context (runs on a worker thread).
+
+        Results for paths that are no longer current are discarded.
+        """
+        image = None
+        try:
+            image = pygame.image.load(path)
+        except (pygame.error, OSError) as e:
+            # Retried on the next context update; render falls back to the URL/no-cover view
+            log.warning("Could not load cover art %s: %s", path, e)
+        with self._decode_lock:
+            self._decoding.discard(path)
+            if image is not None and path == self._cached_path:
+                self._decoded_current = image
+
+    def _is_decoding(self, path: str) -> bool:
+        """Return True while a worker thread is still decoding the cover at path."""
+        with self._decode_lock:
+            return path in self._decoding
 
     def render(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
         """Render the cover art panel."""
-        if not self._context:
+        if not self._context or self._is_clipped_out(surface, rect):
             return
 
         # Check for local cover art first
-        if self._context.cover_art_path and os.path.isfile(self._context.cover_art_path):
+        if self._cover_path_exists:
             # Use local cover art (existing logic)
-            if self._cover_surface is None:
-                with contextlib.suppress(Exception):
-                    img = pygame.image.load(self._context.cover_art_path)
-                    img_w, img_h = img.get_size()
-                    target_w, target_h = rect.width - 32, rect.height - 32
-
-                    if img_w > 0 and img_h > 0:
-                        scale = min(target_w / img_w, target_h / img_h)
-                        new_w = max(1, int(img_w * scale))
-                        new_h = max(1, int(img_h * scale))
-                        self._cover_surface = pygame.transform.smoothscale(img, (new_w, new_h))
-
-            if self._cover_surface:
-                cover_rect = self._cover_surface.get_rect(center=rect.center)
-                surface.blit(self._cover_surface, cover_rect)
+            cover_surface = self._get_scaled_cover(rect.width, rect.height)
+            if cover_surface:
+                cover_rect = cover_surface.get_rect(center=rect.center)
+                surface.blit(cover_surface, cover_rect)
 
                 if self._context.is_held:
                     pygame.draw.rect(surface, (255, 210, 140), cover_rect, 3)
                 return
 
+            if self._is_decoding(self._context.cover_art_path):
+                pygame.draw.rect(surface, (28, 28, 36), rect, 2)
+                text = self._render_text("Loading cover art...", 24, (170, 170, 170))
+                surface.blit(text, text.get_rect(center=rect.center))
+                return
+
         # Check for enrichment cover art URLs
-        enrichment = getattr(self._context, "enrichment_data", None)
+        enrichment = self._context.enrichment_data
         if enrichment and enrichment.get("cover_art_urls"):
             cover_url_info = enrichment["cover_art_urls"][0]  # Use first available
             url = cover_url_info.get("url")
@@ -77,7 +127,6 @@ class CoverArtPanel(ContentPanel):
             # For now, show placeholder with URL info
             pygame.draw.rect(surface, (40, 40, 60), rect, 2)
 
-            font = pygame.font.Font(None, 20)
             lines = [
                 "Cover Art Available:",
                 f"Source: {cover_url_info.get('source', 'unknown')}",
@@ -92,7 +141,7 @@ class CoverArtPanel(ContentPanel):
 
             y = rect.top + 20
             for line in lines[:8]:  # Limit lines
-                text = font.render(line, True, (180, 180, 200))
+                text = self._render_text(line, 20, (180, 180, 200))
                 surface.blit(text, (rect.left + 20, y))
                 y += 22
 
@@ -100,7 +149,49 @@ class CoverArtPanel(ContentPanel):
 
         # No cover art available
         pygame.draw.rect(surface, (28, 28, 36), rect, 2)
-        font = pygame.font.Font(None, 24)
-        text = font.render("No cover art", True, (170, 170, 170))
+        text = self._render_text("No cover art", 24, (170, 170, 170))
         text_rect = text.get_rect(center=rect.center)
         surface.blit(text, text_rect)
+
+    def _get_scaled_cover(self, width: int, height: int) -> Optional[pygame.Surface]:
+        """Get the cover scaled to fit a panel of the given size.
+
+        The image file is decoded once per cover path on a worker thread, and None is
+        returned until it is ready. Each panel size then scales from that decoded image
+        on the render thread, and the most recent sizes are kept in the display's pixel
+        format once a display mode is set.
+        """
+        size = (width, height)
+        cover_surface = self._scaled_covers.get(size)
+        if cover_surface is not None:
+            return cover_surface
+
+        if self._cover_image is None:
+            # The file is decoded on a worker thread; nothing to draw until it lands
+            with self._decode_lock:
+                self._cover_image = self._decoded_current
+                self._decoded_current = None
+            if self._cover_image is None:
+                return None
+
+        img_w, img_h = self._cover_image.get_size()
+        if img_w <= 0 or img_h <= 0:
+            return None
+
+        target_w, target_h = width - 32, height - 32
+        scale = min(target_w / img_w, target_h / img_h)
+        new_w = max(1, int(img_w * scale))
+        new_h = max(1, int(img_h * scale))
+        cover_surface = pygame.transform.smoothscale(self._cover_image, (new_w, new_h))
+        if pygame.display.get_surface() is not None:
+            # Match the display's pixel format so blits skip per-pixel conversion
+            if cover_surface.get_flags() & pygame.SRCALPHA:
+                cover_surface = cover_surface.convert_alpha()
+            else:
+                cover_surface = cover_surface.convert()
+
+        if len(self._scaled_covers) >= self.MAX_SCALED_COVERS:
+            # Drop the oldest size (dicts keep insertion order)
+            del self._scaled_covers[next(iter(self._scaled_covers))]
+        self._scaled_covers[size] = cover_surface
+        return cover_surface
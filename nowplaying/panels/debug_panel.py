@@ -6,12 +6,26 @@ Useful for development and troubleshooting.
 """
 
 import contextlib
+from itertools import islice
+from typing import List, Optional, Tuple
 
 import pygame
 
 from .base import ContentContext, ContentPanel, PanelInfo
 
 
+# Scalar types whose falsy values (False, 0, 0.0, "") count as unset
+_SCALAR_TYPES = (bool, int, float, str)
+
+
+def _count_set_fields(context: ContentContext) -> int:
+    """Count context fields that hold a value, i.e. are not None, False, zero or an empty string."""
+    # Exact type checks avoid calling __eq__ on arbitrary field values such as dicts
+    return sum(
+        1 for value in vars(context).values() if value is not None and not (type(value) in _SCALAR_TYPES and not value)
+    )
+
+
 class DebugPanel(ContentPanel):
     """Debug information panel."""
 
@@ -31,10 +45,21 @@ class DebugPanel(ContentPanel):
         self._touch_scroll_active = False
         self._touch_scroll_start_y = None
         self._touch_scroll_start_offset = 0
+        self._max_scroll = self._scroll_limit(None)  # Recomputed per context, read on every scroll event
+        # Blit sequence for the last frame, rebuilt only when marked dirty or the panel moves
+        self._blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._dirty = True
+        self._last_rect: Optional[Tuple[int, int, int, int]] = None
+        self._last_enrichment = None
+        # Left and right column strings for the current context; scrolling only re-slices them
+        self._lines: Optional[Tuple[List[str], List[str]]] = None
 
     def update_context(self, context: ContentContext) -> None:
         """Update with new context."""
         self._context = context
+        self._max_scroll = self._scroll_limit(context)
+        self._lines = None
+        self._dirty = True
 
     def can_display(self, _context: ContentContext) -> bool:  # noqa: U101 - overrides base signature, unused here
         """Debug panel can always display regardless of context."""
@@ -42,13 +67,33 @@ class DebugPanel(ContentPanel):
 
     def render(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
         """Render debug information with vertical scrolling."""
-        if not hasattr(self, "_context") or not self._context:
+        if not self._context or self._is_clipped_out(surface, rect):
             return
 
-        font = pygame.font.Font(None, 24)
-        y_offset = rect.top + 10
-        line_height = self._line_height
-
+        # Enrichment data is attached to the context after it arrives and changes the field count
+        rect_key = (rect.left, rect.top, rect.width, rect.height)
+        enrichment = self._context.enrichment_data
+        if enrichment is not self._last_enrichment:
+            self._lines = None
+        if self._dirty or rect_key != self._last_rect or enrichment is not self._last_enrichment:
+            self._blits = self._build_blits(rect)
+            self._dirty = False
+            self._last_rect = rect_key
+            self._last_enrichment = enrichment
+
+        surface.blits(self._blits, doreturn=False)
+
+    @staticmethod
+    def _scroll_limit(context: Optional[ContentContext]) -> int:
+        """Return the largest scroll offset for a context."""
+        lines_count = 22
+        if context:
+            with contextlib.suppress(Exception):
+                lines_count = 22 + len(getattr(context, "enrichment", {}))
+        return max(0, lines_count - 1)
+
+    def _build_lines(self) -> Tuple[List[str], List[str]]:
+        """Format the metadata (left) and technical (right) column strings for the current context."""
         # Show all known ContentContext attributes
         ctx = self._context
         left_lines = [
@@ -57,7 +102,7 @@ class DebugPanel(ContentPanel):
             f"Album: {ctx.album or 'Unknown'}",
             f"Genre: {ctx.genre or 'Unknown'}",
             f"Cover Art Path: {ctx.cover_art_path or 'None'}",
-            f"Playback State: {getattr(ctx, 'playback_state', 'Unknown')}",
+            f"Playback State: {ctx.playback_state}",
             f"Year: {ctx.year or 'Unknown'}",
             f"Track #: {ctx.track_number or 'Unknown'}",
             f"Album Artist: {ctx.album_artist or 'Unknown'}",
@@ -74,58 +119,64 @@ class DebugPanel(ContentPanel):
         ]
 
         # Technical info and enrichment (right side)
+        enrichment = getattr(ctx, "enrichment", {})
         right_lines = [
             "Technical Info:",
             f"Context Type: {type(ctx).__name__}",
-            f"Metadata Keys: {len([v for v in vars(ctx).values() if v not in (None, '', False)])} fields",
-            f"Enrichment: {len(getattr(ctx, 'enrichment', {}))} services",
+            f"Metadata Keys: {_count_set_fields(ctx)} fields",
+            f"Enrichment: {len(enrichment)} services",
         ]
-        enrichment = getattr(ctx, "enrichment", {})
         for service_id, enrichment_data in enrichment.items():
             meta = getattr(enrichment_data, "metadata", None)
             if isinstance(meta, dict):
                 right_lines.append(f"  {service_id}: {len(meta)} fields")
             else:
                 right_lines.append(f"  {service_id}: (no metadata)")
+        return left_lines, right_lines
 
-        # Calculate visible lines for each column
-        max_visible_lines = (rect.height - 20) // line_height
-        start = self._scroll_offset
-        end_left = min(start + max_visible_lines, len(left_lines))
-        end_right = min(start + max_visible_lines, len(right_lines))
-        visible_left = left_lines[start:end_left]
-        visible_right = right_lines[start:end_right]
+    def _build_blits(self, rect: pygame.Rect) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Lay out both columns for the current context and scroll position."""
+        y_offset = rect.top + 10
+        line_height = self._line_height
+        if self._lines is None:
+            self._lines = self._build_lines()
+        left_lines, right_lines = self._lines
 
-        # Left column (main metadata)
-        for i, line in enumerate(visible_left):
-            text_surface = font.render(line, True, (255, 255, 255))
-            surface.blit(text_surface, (rect.left + 10, y_offset + i * line_height))
+        # Visible lines for each column, walked in place rather than copied out with a slice
+        max_visible_lines = max(0, (rect.height - 20) // line_height)
+        start = self._scroll_offset
+        visible_left = islice(left_lines, start, start + max_visible_lines)
+        visible_right = islice(right_lines, start, start + max_visible_lines)
 
-        # Right column (technical info)
+        # Both columns are drawn by render with a single Surface.blits call
+        left_x = rect.left + 10
         right_x = rect.left + rect.width // 2 + 10
-        for i, line in enumerate(visible_right):
-            text_surface = font.render(line, True, (200, 200, 255))
-            surface.blit(text_surface, (right_x, y_offset + i * line_height))
+        blits = [
+            (self._render_text(line, 24, (255, 255, 255)), (left_x, y_offset + i * line_height))
+            for i, line in enumerate(visible_left)  # Left column (main metadata)
+        ]
+        blits.extend(
+            (self._render_text(line, 24, (200, 200, 255)), (right_x, y_offset + i * line_height))
+            for i, line in enumerate(visible_right)  # Right column (technical info)
+        )
+        return blits
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle events for debug panel (scroll with mouse wheel, arrow keys, or touch)."""
         # Mouse wheel scroll (pygame 2.x: event.type == pygame.MOUSEWHEEL)
         if event.type == pygame.MOUSEWHEEL:
             self._scroll_offset = max(0, self._scroll_offset - event.y)
+            self._dirty = True
             return True
         # Keyboard scroll
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self._scroll_offset = max(0, self._scroll_offset - 1)
+                self._dirty = True
                 return True
             elif event.key == pygame.K_DOWN:
-                ctx = self._context
-                lines_count = 22
-                if ctx:
-                    with contextlib.suppress(Exception):
-                        lines_count = 22 + len(getattr(ctx, "enrichment", {}))
-                max_scroll = max(0, lines_count - 1)
-                self._scroll_offset = min(self._scroll_offset + 1, max_scroll)
+                self._scroll_offset = min(self._scroll_offset + 1, self._max_scroll)
+                self._dirty = True
                 return True
         # Touch scroll (FINGERDOWN/FINGERMOTION)
         elif event.type == pygame.FINGERDOWN:
@@ -142,14 +193,9 @@ class DebugPanel(ContentPanel):
             # Only consume if vertical swipe is dominant
             if abs(dy_pixels) > abs(dx_pixels) and abs(dy_pixels) > 10:
                 lines_moved = int(-dy_pixels // self._line_height)
-                ctx = self._context
-                lines_count = 22
-                if ctx:
-                    with contextlib.suppress(Exception):
-                        lines_count = 22 + len(getattr(ctx, "enrichment", {}))
-                max_scroll = max(0, lines_count - 1)
                 new_offset = self._touch_scroll_start_offset + lines_moved
-                self._scroll_offset = max(0, min(new_offset, max_scroll))
+                self._scroll_offset = max(0, min(new_offset, self._max_scroll))
+                self._dirty = True
                 return True
             # else: let event propagate for navigation
             return False
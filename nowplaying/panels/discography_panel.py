@@ -4,10 +4,30 @@ Discography panel implementation.
 Displays artist discography and release history.
 """
 
+from typing import Any, Dict, List, Tuple
+
 import pygame
 
 from .base import ContentContext, ContentPanel, PanelInfo
 
+# Release type -> [(year, releases), ...] with types sorted by name and years most recent first
+GroupedReleases = List[Tuple[Any, List[Tuple[Any, List[Dict[str, Any]]]]]]
+
+
+def _group_releases(discography) -> GroupedReleases:
+    """Group releases by type and year, sorted in display order."""
+    releases_by_type = {}
+    for release in discography:
+        if isinstance(release, dict):
+            release_type = release.get("format", "Album")  # Default to Album
+            year = release.get("year", "Unknown")
+            releases_by_type.setdefault(release_type, {}).setdefault(year, []).append(release)
+
+    return [
+        (release_type, sorted(releases_by_type[release_type].items(), reverse=True, key=lambda item: item[0]))
+        for release_type in sorted(releases_by_type)
+    ]
+
 
 class DiscographyPanel(ContentPanel):
     """Panel for displaying artist discography."""
@@ -23,6 +43,9 @@ class DiscographyPanel(ContentPanel):
                 category="discovery",
             )
         )
+        # Grouped releases and the discography list they were built from
+        self._grouped: GroupedReleases = []
+        self._grouped_source = None
 
     def can_display(self, context: ContentContext) -> bool:
         """Check if artist context is available."""
@@ -31,54 +54,48 @@ class DiscographyPanel(ContentPanel):
     def update_context(self, context: ContentContext) -> None:
         """Update panel with new context."""
         self._context = context
+        self._update_grouping()
+
+    def _update_grouping(self) -> None:
+        """Regroup the discography when the context's release list has been replaced."""
+        enrichment = self._context.enrichment_data if self._context else None
+        discography = enrichment.get("artist_discography") if enrichment else None
+        if discography is not self._grouped_source:
+            self._grouped = _group_releases(discography) if discography else []
+            self._grouped_source = discography
 
     def render(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
         """Render panel content."""
-        if not self._context:
+        if not self._context or self._is_clipped_out(surface, rect):
             return
 
-        font = pygame.font.Font(None, 20)
-        small_font = pygame.font.Font(None, 16)
         y = rect.top + 10
+        # Collected and drawn with a single Surface.blits call at the end
+        blits = []
 
-        enrichment = getattr(self._context, "enrichment_data", None)
+        enrichment = self._context.enrichment_data
 
         # Title
-        title_text = font.render("Artist Discography", True, (120, 170, 255))
-        surface.blit(title_text, (rect.left + 20, y))
+        title_text = self._render_text("Artist Discography", 20, (120, 170, 255))
+        blits.append((title_text, (rect.left + 20, y)))
         y += 35
 
         if enrichment and enrichment.get("artist_discography"):
-            discography = enrichment["artist_discography"]
-
-            # Group releases by type/year for better organization
-            releases_by_type = {}
-            for release in discography:
-                if isinstance(release, dict):
-                    release_type = release.get("format", "Album")  # Default to Album
-                    year = release.get("year", "Unknown")
-
-                    if release_type not in releases_by_type:
-                        releases_by_type[release_type] = {}
-                    if year not in releases_by_type[release_type]:
-                        releases_by_type[release_type][year] = []
-
-                    releases_by_type[release_type][year].append(release)
+            # Enrichment data may be attached to the context after update_context
+            self._update_grouping()
+            grouped = self._grouped
 
             # Display releases grouped by type and year
-            for release_type in sorted(releases_by_type.keys()):
-                type_title = small_font.render(f"{release_type}s:", True, (230, 230, 230))
-                surface.blit(type_title, (rect.left + 20, y))
+            for type_index, (release_type, type_releases) in enumerate(grouped):
+                type_title = self._render_text(f"{release_type}s:", 16, (230, 230, 230))
+                blits.append((type_title, (rect.left + 20, y)))
                 y += 20
 
-                type_releases = releases_by_type[release_type]
-                for year in sorted(type_releases.keys(), reverse=True):  # Most recent first
-                    year_releases = type_releases[year]
-
+                for year, year_releases in type_releases:  # Most recent first
                     for release in year_releases[:3]:  # Limit per year
                         title = release.get("title", "Unknown Title")
-                        release_text = small_font.render(f"{year} - {title}", True, (180, 180, 180))
-                        surface.blit(release_text, (rect.left + 30, y))
+                        release_text = self._render_text(f"{year} - {title}", 16, (180, 180, 180))
+                        blits.append((release_text, (rect.left + 30, y)))
                         y += 18
 
                         # Check if we have enough space for more
@@ -92,19 +109,21 @@ class DiscographyPanel(ContentPanel):
 
                 # Check if we need to stop due to space
                 if y > rect.bottom - 50:
-                    remaining_types = len(releases_by_type) - list(releases_by_type.keys()).index(release_type) - 1
+                    remaining_types = len(grouped) - type_index - 1
                     if remaining_types > 0:
-                        more_text = small_font.render(
-                            f"... and {remaining_types} more release types", True, (150, 150, 150)
+                        more_text = self._render_text(
+                            f"... and {remaining_types} more release types", 16, (150, 150, 150)
                         )
-                        surface.blit(more_text, (rect.left + 20, y))
+                        blits.append((more_text, (rect.left + 20, y)))
                     break
 
         elif enrichment:
             # Has enrichment data but no discography
-            no_discog = font.render("No discography data available", True, (150, 150, 150))
-            surface.blit(no_discog, (rect.left + 20, y))
+            no_discog = self._render_text("No discography data available", 20, (150, 150, 150))
+            blits.append((no_discog, (rect.left + 20, y)))
         else:
             # No enrichment data at all
-            no_data = font.render("No enrichment data available", True, (150, 150, 150))
-            surface.blit(no_data, (rect.left + 20, y))
+            no_data = self._render_text("No enrichment data available", 20, (150, 150, 150))
+            blits.append((no_data, (rect.left + 20, y)))
+
+        surface.blits(blits, doreturn=False)
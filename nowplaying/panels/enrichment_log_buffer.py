@@ -2,16 +2,20 @@
 
 import logging
 from collections import deque
+from itertools import islice
 
 
 class EnrichmentLogBuffer:
     """Buffer for capturing enrichment logging output."""
 
-    def __init__(self, logger_name: str, max_lines: int = 50):
+    def __init__(self, logger_name: str, max_lines: int = 50, max_line_length: int = 120):
         """Initialize the EnrichmentLogBuffer."""
         self.logger = logging.getLogger(logger_name)
         self.max_lines = max_lines
+        # Longer lines would run far past the log column, so they are cut once when captured
+        self.max_line_length = max_line_length
         self.buffer = deque(maxlen=max_lines)
+        self.revision = 0  # Bumped on every captured line, so readers can tell when to refresh
         self._install_handler()
 
     def _install_handler(self):
@@ -25,7 +29,8 @@ class EnrichmentLogBuffer:
     def write(self, message):
         """Write message to buffer."""
         if message.strip():
-            self.buffer.append(message.rstrip())
+            self.buffer.append(message.rstrip()[: self.max_line_length])
+            self.revision += 1
 
     def flush(self):
         """Flush buffer (no-op for this implementation)."""
@@ -34,3 +39,7 @@ class EnrichmentLogBuffer:
     def get_lines(self):
         """Get buffered log lines."""
         return list(self.buffer)
+
+    def get_tail(self, count: int):
+        """Get the last ``count`` buffered log lines without copying the whole buffer."""
+        return list(islice(self.buffer, max(0, len(self.buffer) - count), None))
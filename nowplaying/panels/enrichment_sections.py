@@ -0,0 +1,113 @@
+"""
+Enrichment sections shared by the album and artist information panels.
+
+Each SectionSpec names the enrichment key it draws from, its title and style,
+and a formatter that turns the value into display lines.
+"""
+
+from typing import Any, Dict, Iterable, List
+
+from .base import SectionLine, SectionSpec, wrap_text
+
+
+def _format_reviews(reviews: Iterable[Any]) -> List[SectionLine]:
+    """Format album reviews as a rating line followed by up to two lines of review text."""
+    lines: List[SectionLine] = []
+    for review in reviews:
+        if isinstance(review, dict):
+            get = review.get
+            lines.append(f"{get('source', 'Unknown')}: {get('rating', 'N/A')}/10")
+            text = get("text")
+            if text:
+                lines.extend((line, (180, 180, 180), 40, 16) for line in wrap_text(text, 50)[:2])
+    return lines
+
+
+def _format_credits(credits: Iterable[Any]) -> List[SectionLine]:
+    """Format album credits as role: artist."""
+    return [f"{credit.get('role', '')}: {credit.get('artist', '')}" for credit in credits if isinstance(credit, dict)]
+
+
+def _format_discography(releases: Iterable[Any]) -> List[SectionLine]:
+    """Format discography entries as year - title (format)."""
+    return [
+        f"{release.get('year', '')} - {release.get('title', '')} ({release.get('format', '')})"
+        for release in releases
+        if isinstance(release, dict)
+    ]
+
+
+def _format_tags(tags: Iterable[str]) -> List[SectionLine]:
+    """Format tags as a comma-separated list wrapped to the panel width."""
+    return list(wrap_text(", ".join(tags), 50))
+
+
+def _format_bio(bio: str) -> List[SectionLine]:
+    """Format the first three wrapped lines of a biography."""
+    return list(wrap_text(bio, 60)[:3])
+
+
+def _format_recent_releases(releases: Iterable[Any]) -> List[SectionLine]:
+    """Format related releases as year - title."""
+    return [
+        f"{release.get('year', '')} - {release.get('title', '')}" for release in releases if isinstance(release, dict)
+    ]
+
+
+def _format_similar_artists(artists: Iterable[Any]) -> List[SectionLine]:
+    """Format similar artists with their match percentage."""
+    return [
+        f"{artist['name']} ({artist.get('match', 0):.1%})"
+        for artist in artists
+        if isinstance(artist, dict) and "name" in artist
+    ]
+
+
+def _format_social_stats(enrichment: Dict[str, Any]) -> List[SectionLine]:
+    """Format scrobble count and popularity score, whichever are present."""
+    lines: List[SectionLine] = []
+    count = enrichment.get("scrobble_count")
+    if count is not None:
+        if count >= 1000000:
+            display_count = f"{count/1000000:.1f}M"
+        elif count >= 1000:
+            display_count = f"{count/1000:.1f}K"
+        else:
+            display_count = str(count)
+        lines.append(f"Scrobbles: {display_count}")
+
+    popularity = enrichment.get("popularity_score")
+    if popularity is not None:
+        lines.append(f"Popularity: {popularity:.1f}/100")
+    return lines
+
+
+def _format_tour_dates(tour_dates: Iterable[Any]) -> List[SectionLine]:
+    """Format upcoming shows as date - venue, city."""
+    return [
+        f"{show.get('date', '')} - {show.get('venue', '')}, {show.get('city', '')}"
+        for show in tour_dates
+        if isinstance(show, dict)
+    ]
+
+
+MUSICBRAINZ_ALBUM_ID = SectionSpec("musicbrainz_album_id", "MusicBrainz ID:", (180, 180, 180), gap=0)
+DISCOGS_RELEASE_ID = SectionSpec("discogs_release_id", "Discogs ID:", (180, 180, 180), gap=0)
+ALBUM_REVIEWS = SectionSpec("album_reviews", "Reviews:", (200, 200, 200), limit=2, formatter=_format_reviews)
+ALBUM_CREDITS = SectionSpec("album_credits", "Credits:", (180, 180, 180), limit=5, formatter=_format_credits)
+ARTIST_DISCOGRAPHY = SectionSpec(
+    "artist_discography", "Discography:", (160, 160, 160), limit=4, formatter=_format_discography
+)
+RECENT_RELEASES = SectionSpec(
+    "recent_releases", "Recent Releases:", (160, 160, 160), limit=3, formatter=_format_recent_releases
+)
+
+MUSICBRAINZ_ARTIST_ID = SectionSpec("musicbrainz_artist_id", "MusicBrainz ID:", (180, 180, 180), gap=0)
+SOCIAL_STATS = SectionSpec(None, "Social Stats:", (255, 210, 140), formatter=_format_social_stats)
+ARTIST_TAGS = SectionSpec("artist_tags", "Tags:", (180, 180, 180), limit=8, formatter=_format_tags)
+USER_TAGS = SectionSpec("user_tags", "User Tags:", (160, 160, 160), limit=6, formatter=_format_tags)
+ARTIST_BIO = SectionSpec("artist_bio", "Biography:", (200, 200, 200), formatter=_format_bio)
+SIMILAR_ARTISTS = SectionSpec(
+    "similar_artists", "Similar Artists:", (160, 160, 160), limit=5, formatter=_format_similar_artists, gap=0
+)
+TOUR_DATES = SectionSpec("tour_dates", "Upcoming Shows:", (140, 160, 255), limit=3, formatter=_format_tour_dates)
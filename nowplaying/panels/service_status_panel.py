@@ -25,6 +25,9 @@ class ServiceStatusPanel(ContentPanel):
                 category="discovery",
             )
         )
+        # Completeness counts for the last enrichment object seen; only the ages change per frame
+        self._completeness = (0, 0)
+        self._completeness_source = None
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle events (not used)."""
@@ -44,22 +47,22 @@ class ServiceStatusPanel(ContentPanel):
         if not self._context:
             return
 
-        font = pygame.font.Font(None, 20)
-        small_font = pygame.font.Font(None, 16)
         y = rect.top + 10
+        # Collected and drawn with a single Surface.blits call at the end
+        blits = []
 
-        enrichment = getattr(self._context, "enrichment_data", None)
+        enrichment = self._context.enrichment_data
 
         # Title
-        title_text = font.render("Service Status", True, (120, 170, 255))
-        surface.blit(title_text, (rect.left + 20, y))
+        title_text = self._render_text("Service Status", 20, (120, 170, 255))
+        blits.append((title_text, (rect.left + 20, y)))
         y += 35
 
         if enrichment:
             # Service Update Times
             if enrichment.get("last_updated"):
-                updates_title = small_font.render("Last Updated:", True, (230, 230, 230))
-                surface.blit(updates_title, (rect.left + 20, y))
+                updates_title = self._render_text("Last Updated:", 16, (230, 230, 230))
+                blits.append((updates_title, (rect.left + 20, y)))
                 y += 20
 
                 current_time = time.time()
@@ -69,59 +72,40 @@ class ServiceStatusPanel(ContentPanel):
                         age_text = self._format_age(age_seconds)
                         status_color = self._get_age_color(age_seconds)
 
-                        service_text = small_font.render(f"{service.title()}:", True, (200, 200, 200))
-                        surface.blit(service_text, (rect.left + 30, y))
+                        service_text = self._render_text(f"{service.title()}:", 16, (200, 200, 200))
+                        blits.append((service_text, (rect.left + 30, y)))
 
-                        age_render = small_font.render(age_text, True, status_color)
-                        surface.blit(age_render, (rect.left + 120, y))
+                        age_render = self._render_text(age_text, 16, status_color)
+                        blits.append((age_render, (rect.left + 120, y)))
                         y += 18
                 y += 10
 
             # Service Errors
             if enrichment.get("service_errors"):
-                errors_title = small_font.render("Service Errors:", True, (230, 230, 230))
-                surface.blit(errors_title, (rect.left + 20, y))
+                errors_title = self._render_text("Service Errors:", 16, (230, 230, 230))
+                blits.append((errors_title, (rect.left + 20, y)))
                 y += 20
 
                 has_errors = False
                 for service, error in enrichment["service_errors"].items():
                     if error:
                         has_errors = True
-                        error_text = small_font.render(
-                            f"{service.title()}: {str(error)[:40]}...", True, (255, 120, 120)
-                        )
-                        surface.blit(error_text, (rect.left + 30, y))
+                        error_text = self._render_text(f"{service.title()}: {str(error)[:40]}...", 16, (255, 120, 120))
+                        blits.append((error_text, (rect.left + 30, y)))
                         y += 18
 
                 if not has_errors:
-                    ok_text = small_font.render("All services OK", True, (120, 255, 120))
-                    surface.blit(ok_text, (rect.left + 30, y))
+                    ok_text = self._render_text("All services OK", 16, (120, 255, 120))
+                    blits.append((ok_text, (rect.left + 30, y)))
                     y += 18
                 y += 10
 
             # Data Completeness
-            completeness_title = small_font.render("Data Completeness:", True, (230, 230, 230))
-            surface.blit(completeness_title, (rect.left + 20, y))
+            completeness_title = self._render_text("Data Completeness:", 16, (230, 230, 230))
+            blits.append((completeness_title, (rect.left + 20, y)))
             y += 20
 
-            # Check various data fields
-            data_fields = {
-                "MusicBrainz IDs": bool(
-                    enrichment.get("musicbrainz_artist_id") or enrichment.get("musicbrainz_album_id")
-                ),
-                "Discogs IDs": bool(enrichment.get("discogs_artist_id") or enrichment.get("discogs_release_id")),
-                "Artist Bio": bool(enrichment.get("artist_bio")),
-                "Artist Tags": bool(enrichment.get("artist_tags")),
-                "Similar Artists": bool(enrichment.get("similar_artists")),
-                "Album Reviews": bool(enrichment.get("album_reviews")),
-                "Cover Art URLs": bool(enrichment.get("cover_art_urls")),
-                "Artist Images": bool(enrichment.get("artist_images")),
-                "Scrobble Data": enrichment.get("scrobble_count") is not None,
-                "Discography": bool(enrichment.get("artist_discography")),
-            }
-
-            complete_count = sum(data_fields.values())
-            total_count = len(data_fields)
+            complete_count, total_count = self._get_completeness(enrichment)
 
             # Progress bar
             bar_width = 150
@@ -132,15 +116,39 @@ class ServiceStatusPanel(ContentPanel):
             pygame.draw.rect(surface, (50, 50, 50), bar_rect)  # Background
             pygame.draw.rect(surface, (120, 170, 255), fill_rect)  # Fill
 
-            completeness_text = small_font.render(
-                f"{complete_count}/{total_count} fields populated", True, (200, 200, 200)
+            completeness_text = self._render_text(
+                f"{complete_count}/{total_count} fields populated", 16, (200, 200, 200)
             )
-            surface.blit(completeness_text, (rect.left + 190, y))
+            blits.append((completeness_text, (rect.left + 190, y)))
             y += 20
 
         else:
-            no_data = font.render("No enrichment data available", True, (150, 150, 150))
-            surface.blit(no_data, (rect.left + 20, y))
+            no_data = self._render_text("No enrichment data available", 20, (150, 150, 150))
+            blits.append((no_data, (rect.left + 20, y)))
+
+        surface.blits(blits, doreturn=False)
+
+    def _get_completeness(self, enrichment: dict) -> tuple:
+        """Return (populated, total) data field counts, recounted only when the enrichment is replaced."""
+        if enrichment is self._completeness_source:
+            return self._completeness
+
+        # Check various data fields
+        data_fields = {
+            "MusicBrainz IDs": bool(enrichment.get("musicbrainz_artist_id") or enrichment.get("musicbrainz_album_id")),
+            "Discogs IDs": bool(enrichment.get("discogs_artist_id") or enrichment.get("discogs_release_id")),
+            "Artist Bio": bool(enrichment.get("artist_bio")),
+            "Artist Tags": bool(enrichment.get("artist_tags")),
+            "Similar Artists": bool(enrichment.get("similar_artists")),
+            "Album Reviews": bool(enrichment.get("album_reviews")),
+            "Cover Art URLs": bool(enrichment.get("cover_art_urls")),
+            "Artist Images": bool(enrichment.get("artist_images")),
+            "Scrobble Data": enrichment.get("scrobble_count") is not None,
+            "Discography": bool(enrichment.get("artist_discography")),
+        }
+        self._completeness = (sum(data_fields.values()), len(data_fields))
+        self._completeness_source = enrichment
+        return self._completeness
 
     def _format_age(self, seconds: float) -> str:
         """Format age in human readable form."""
@@ -4,6 +4,8 @@ Song Enrichment panel implementation.
 Displays track-specific information and enrichment data.
 """
 
+from itertools import islice
+
 import pygame
 
 from .base import ContentContext, ContentPanel, PanelInfo
@@ -37,95 +39,95 @@ class SongEnrichmentPanel(ContentPanel):
         if not self._context:
             return
 
-        font = pygame.font.Font(None, 20)
-        small_font = pygame.font.Font(None, 16)
         y = rect.top + 10
+        # Collected and drawn with a single Surface.blits call at the end
+        blits = []
 
-        enrichment = getattr(self._context, "enrichment_data", None)
+        enrichment = self._context.enrichment_data
 
         # Title
-        title_text = font.render("Song Enrichment", True, (120, 170, 255))
-        surface.blit(title_text, (rect.left + 20, y))
+        title_text = self._render_text("Song Enrichment", 20, (120, 170, 255))
+        blits.append((title_text, (rect.left + 20, y)))
         y += 35
 
         # Basic track information
-        track_info_title = small_font.render("Track Information:", True, (230, 230, 230))
-        surface.blit(track_info_title, (rect.left + 20, y))
+        track_info_title = self._render_text("Track Information:", 16, (230, 230, 230))
+        blits.append((track_info_title, (rect.left + 20, y)))
         y += 20
 
         # Track title
         if self._context.title:
-            title_label = small_font.render("Title:", True, (200, 200, 200))
-            surface.blit(title_label, (rect.left + 30, y))
-            title_value = small_font.render(self._context.title, True, (180, 180, 180))
-            surface.blit(title_value, (rect.left + 80, y))
+            title_label = self._render_text("Title:", 16, (200, 200, 200))
+            blits.append((title_label, (rect.left + 30, y)))
+            title_value = self._render_text(self._context.title, 16, (180, 180, 180))
+            blits.append((title_value, (rect.left + 80, y)))
             y += 18
 
         # Artist
         if self._context.artist:
-            artist_label = small_font.render("Artist:", True, (200, 200, 200))
-            surface.blit(artist_label, (rect.left + 30, y))
-            artist_value = small_font.render(self._context.artist, True, (180, 180, 180))
-            surface.blit(artist_value, (rect.left + 80, y))
+            artist_label = self._render_text("Artist:", 16, (200, 200, 200))
+            blits.append((artist_label, (rect.left + 30, y)))
+            artist_value = self._render_text(self._context.artist, 16, (180, 180, 180))
+            blits.append((artist_value, (rect.left + 80, y)))
             y += 18
 
         # Album
         if self._context.album:
-            album_label = small_font.render("Album:", True, (200, 200, 200))
-            surface.blit(album_label, (rect.left + 30, y))
-            album_value = small_font.render(self._context.album, True, (180, 180, 180))
-            surface.blit(album_value, (rect.left + 80, y))
+            album_label = self._render_text("Album:", 16, (200, 200, 200))
+            blits.append((album_label, (rect.left + 30, y)))
+            album_value = self._render_text(self._context.album, 16, (180, 180, 180))
+            blits.append((album_value, (rect.left + 80, y)))
             y += 18
 
         # Track number
         if self._context.track_number:
-            track_num_label = small_font.render("Track:", True, (200, 200, 200))
-            surface.blit(track_num_label, (rect.left + 30, y))
-            track_num_value = small_font.render(self._context.track_number, True, (180, 180, 180))
-            surface.blit(track_num_value, (rect.left + 80, y))
+            track_num_label = self._render_text("Track:", 16, (200, 200, 200))
+            blits.append((track_num_label, (rect.left + 30, y)))
+            track_num_value = self._render_text(self._context.track_number, 16, (180, 180, 180))
+            blits.append((track_num_value, (rect.left + 80, y)))
             y += 18
 
         # Duration
         if self._context.duration:
-            duration_label = small_font.render("Duration:", True, (200, 200, 200))
-            surface.blit(duration_label, (rect.left + 30, y))
+            duration_label = self._render_text("Duration:", 16, (200, 200, 200))
+            blits.append((duration_label, (rect.left + 30, y)))
             # Format duration as MM:SS
             duration_seconds = int(self._context.duration)
             minutes = duration_seconds // 60
             seconds = duration_seconds % 60
             duration_str = f"{minutes}:{seconds:02d}"
-            duration_value = small_font.render(duration_str, True, (180, 180, 180))
-            surface.blit(duration_value, (rect.left + 80, y))
+            duration_value = self._render_text(duration_str, 16, (180, 180, 180))
+            blits.append((duration_value, (rect.left + 80, y)))
             y += 18
 
         # Genre
         if self._context.genre:
-            genre_label = small_font.render("Genre:", True, (200, 200, 200))
-            surface.blit(genre_label, (rect.left + 30, y))
-            genre_value = small_font.render(self._context.genre, True, (180, 180, 180))
-            surface.blit(genre_value, (rect.left + 80, y))
+            genre_label = self._render_text("Genre:", 16, (200, 200, 200))
+            blits.append((genre_label, (rect.left + 30, y)))
+            genre_value = self._render_text(self._context.genre, 16, (180, 180, 180))
+            blits.append((genre_value, (rect.left + 80, y)))
             y += 18
 
         y += 10  # Spacing
 
         # Song credits section
         if enrichment and enrichment.get("song_credits"):
-            credits_title = small_font.render("Song Credits:", True, (230, 230, 230))
-            surface.blit(credits_title, (rect.left + 20, y))
+            credits_title = self._render_text("Song Credits:", 16, (230, 230, 230))
+            blits.append((credits_title, (rect.left + 20, y)))
             y += 20
 
-            for _i, credit in enumerate(enrichment["song_credits"][:8]):  # Limit to 8 credits
+            for credit in islice(enrichment["song_credits"], 8):  # Limit to 8 credits
                 role = credit.get("role", "Unknown")
                 artist = credit.get("artist", "Unknown")
-                credit_text = small_font.render(f"{role}: {artist}", True, (180, 180, 180))
-                surface.blit(credit_text, (rect.left + 30, y))
+                credit_text = self._render_text(f"{role}: {artist}", 16, (180, 180, 180))
+                blits.append((credit_text, (rect.left + 30, y)))
                 y += 18
 
             if len(enrichment["song_credits"]) > 8:
-                more_credits = small_font.render(
-                    f"... and {len(enrichment['song_credits']) - 8} more", True, (150, 150, 150)
+                more_credits = self._render_text(
+                    f"... and {len(enrichment['song_credits']) - 8} more", 16, (150, 150, 150)
                 )
-                surface.blit(more_credits, (rect.left + 30, y))
+                blits.append((more_credits, (rect.left + 30, y)))
                 y += 18
 
             y += 10  # Spacing
@@ -134,29 +136,29 @@ class SongEnrichmentPanel(ContentPanel):
         if enrichment:
             # MusicBrainz Track ID
             if enrichment.get("musicbrainz_track_id"):
-                mb_track_title = small_font.render("MusicBrainz Track ID:", True, (230, 230, 230))
-                surface.blit(mb_track_title, (rect.left + 20, y))
+                mb_track_title = self._render_text("MusicBrainz Track ID:", 16, (230, 230, 230))
+                blits.append((mb_track_title, (rect.left + 20, y)))
                 y += 20
-                mb_track_text = small_font.render(enrichment["musicbrainz_track_id"], True, (180, 180, 180))
-                surface.blit(mb_track_text, (rect.left + 30, y))
+                mb_track_text = self._render_text(enrichment["musicbrainz_track_id"], 16, (180, 180, 180))
+                blits.append((mb_track_text, (rect.left + 30, y)))
                 y += 18
 
             # Spotify IDs (if available)
             if enrichment.get("spotify_artist_id") or enrichment.get("spotify_album_id"):
-                spotify_title = small_font.render("Spotify IDs:", True, (230, 230, 230))
-                surface.blit(spotify_title, (rect.left + 20, y))
+                spotify_title = self._render_text("Spotify IDs:", 16, (230, 230, 230))
+                blits.append((spotify_title, (rect.left + 20, y)))
                 y += 20
                 if enrichment.get("spotify_artist_id"):
-                    spotify_artist_text = small_font.render(
-                        f"Artist: {enrichment['spotify_artist_id']}", True, (180, 180, 180)
+                    spotify_artist_text = self._render_text(
+                        f"Artist: {enrichment['spotify_artist_id']}", 16, (180, 180, 180)
                     )
-                    surface.blit(spotify_artist_text, (rect.left + 30, y))
+                    blits.append((spotify_artist_text, (rect.left + 30, y)))
                     y += 18
                 if enrichment.get("spotify_album_id"):
-                    spotify_album_text = small_font.render(
-                        f"Album: {enrichment['spotify_album_id']}", True, (180, 180, 180)
+                    spotify_album_text = self._render_text(
+                        f"Album: {enrichment['spotify_album_id']}", 16, (180, 180, 180)
                     )
-                    surface.blit(spotify_album_text, (rect.left + 30, y))
+                    blits.append((spotify_album_text, (rect.left + 30, y)))
                     y += 18
 
             # Technical info
@@ -167,13 +169,15 @@ class SongEnrichmentPanel(ContentPanel):
                 tech_info.append(("Format", self._context.format.upper()))
 
             if tech_info:
-                tech_title = small_font.render("Technical Info:", True, (230, 230, 230))
-                surface.blit(tech_title, (rect.left + 20, y))
+                tech_title = self._render_text("Technical Info:", 16, (230, 230, 230))
+                blits.append((tech_title, (rect.left + 20, y)))
                 y += 20
                 for label, value in tech_info:
-                    tech_text = small_font.render(f"{label}: {value}", True, (160, 160, 160))
-                    surface.blit(tech_text, (rect.left + 30, y))
+                    tech_text = self._render_text(f"{label}: {value}", 16, (160, 160, 160))
+                    blits.append((tech_text, (rect.left + 30, y)))
                     y += 18
         else:
-            no_enrichment = small_font.render("No additional enrichment data available", True, (150, 150, 150))
-            surface.blit(no_enrichment, (rect.left + 20, y))
+            no_enrichment = self._render_text("No additional enrichment data available", 16, (150, 150, 150))
+            blits.append((no_enrichment, (rect.left + 20, y)))
+
+        surface.blits(blits, doreturn=False)
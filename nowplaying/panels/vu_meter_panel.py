@@ -37,8 +37,7 @@ class VUMeterPanel(ContentPanel):
         """Render VU meters."""
         if not self._context or not self._context.audio_levels:
             # Draw placeholder
-            font = pygame.font.Font(None, 24)
-            text = font.render("No audio data", True, (170, 170, 170))
+            text = self._render_text("No audio data", 24, (170, 170, 170))
             text_rect = text.get_rect(center=rect.center)
             surface.blit(text, text_rect)
             return
@@ -50,6 +49,7 @@ class VUMeterPanel(ContentPanel):
 
         levels = self._context.audio_levels
         x = rect.x + margin
+        labels = []  # Channel labels, drawn over the bars with a single Surface.blits call
 
         for channel, level in levels.items():
             # Clamp level to 0-1
@@ -74,9 +74,10 @@ class VUMeterPanel(ContentPanel):
             pygame.draw.rect(surface, color, level_rect)
 
             # Channel label
-            font = pygame.font.Font(None, 16)
-            label = font.render(channel.upper(), True, (200, 200, 200))
+            label = self._render_text(channel.upper(), 16, (200, 200, 200))
             label_rect = label.get_rect(center=(x + bar_width // 2, rect.bottom - 10))
-            surface.blit(label, label_rect)
+            labels.append((label, label_rect))
 
             x += bar_spacing
+
+        surface.blits(labels, doreturn=False)
@@ -13,7 +13,14 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from nowplaying.panels.base import ContentContext, ContentPanel, PanelInfo
+from nowplaying.panels.base import (
+    ContentContext,
+    ContentPanel,
+    PanelInfo,
+    SectionedContentPanel,
+    SectionSpec,
+    wrap_text,
+)
 from nowplaying.playback_state import PlaybackState
 
 
@@ -92,6 +99,32 @@ class TestContentContext:
         assert context.source == "manual"
         assert context.is_held is False
 
+    def test_content_context_round_trips_every_field(self):
+        """Test that from_metadata and hold carry over every content field."""
+        metadata = {
+            "artist": "Artist",
+            "album_artist": "Album Artist",
+            "composer": "Composer",
+            "bitrate": "320k",
+            "format": "mp3",
+            "audio_levels": {"left": 0.5},
+            "artist_id": "a1",
+            "album_id": "b1",
+            "enrichment_data": {"artist_bio": "Bio"},
+            "is_held": True,  # State fields are not taken from metadata
+            "source": "held",
+        }
+        context = ContentContext.from_metadata(metadata, PlaybackState.PLAYING)
+        assert context.is_held is False
+        assert context.source == "live"
+
+        held = context.hold()
+        for name in metadata:
+            if name not in ("is_held", "source"):
+                assert getattr(held, name) == metadata[name]
+        assert held.enrichment_data is context.enrichment_data
+        assert held.playback_state == PlaybackState.PLAYING
+
     def test_content_context_hold(self):
         """Test creating held copy of ContentContext."""
         original = ContentContext(
@@ -324,7 +357,120 @@ class TestContentPanel:
         assert self.panel.event_handled is True
         assert result is True
 
+    def test_get_font_reuses_fonts_per_size(self):
+        """Test that fonts are created once per size and reused."""
+        with patch("pygame.font.Font") as mock_font:
+            mock_font.side_effect = lambda *_args: Mock()
+
+            small = self.panel._get_font(16)
+            assert self.panel._get_font(16) is small
+            assert self.panel._get_font(20) is not small
+
+        assert mock_font.call_count == 2
+
+    def test_render_text_reuses_surfaces(self):
+        """Test that identical text renders are served from the per-panel cache."""
+        self.panel.TEXT_CACHE_SIZE = 2
+        with patch("pygame.font.Font") as mock_font:
+            font = mock_font.return_value
+            font.render.side_effect = lambda *_args: Mock()
+
+            label = self.panel._render_text("Label:", 16, (230, 230, 230))
+            assert self.panel._render_text("Label:", 16, (230, 230, 230)) is label
+            assert font.render.call_count == 1
+
+            # Oldest surfaces are evicted once the cache is full
+            self.panel._render_text("Value", 16, (180, 180, 180))
+            self.panel._render_text("Other", 16, (180, 180, 180))
+            assert ("Label:", 16, (230, 230, 230)) not in self.panel._text_cache
+            assert font.render.call_count == 3
+
+    def test_render_text_converts_to_display_format(self):
+        """Test that cached text is converted only once a display mode is set."""
+        with patch("pygame.font.Font") as mock_font, patch("pygame.display.get_surface", return_value=None):
+            raw = self.panel._render_text("Before", 16, (230, 230, 230))
+        assert raw is mock_font.return_value.render.return_value
+        raw.convert_alpha.assert_not_called()
+
+        with patch("pygame.font.Font") as mock_font, patch("pygame.display.get_surface", return_value=Mock()):
+            converted = self.panel._render_text("After", 20, (230, 230, 230))
+            assert self.panel._render_text("After", 20, (230, 230, 230)) is converted
+        rendered = mock_font.return_value.render.return_value
+        rendered.convert_alpha.assert_called_once_with()
+        assert converted is rendered.convert_alpha.return_value
+
     def test_concrete_panel_cannot_be_instantiated_from_abc(self):
         """Test that ContentPanel cannot be instantiated directly."""
         with pytest.raises(TypeError):
             ContentPanel(self.panel_info)  # Should fail - abstract class
+
+
+class TestWrapText:
+    """Test cases for the shared wrap_text helper."""
+
+    def test_wrap_text_keeps_words_whole(self):
+        """Test word wrapping keeps words whole and normalizes whitespace."""
+        assert wrap_text("A  landmark\trecord of the decade", 16) == ("A landmark", "record of the", "decade")
+        assert wrap_text("self-titled supercalifragilistic", 10) == ("self-titled", "supercalifragilistic")
+        assert wrap_text("", 10) == ()
+
+    def test_wrap_text_fills_lines_exactly(self):
+        """Test that a line may reach max_chars but never exceed it."""
+        assert wrap_text("aaaa bbbbb cc", 10) == ("aaaa bbbbb", "cc")
+        assert wrap_text("aaaa bbbbbb", 10) == ("aaaa", "bbbbbb")
+
+    def test_wrap_text_is_memoized(self):
+        """Test that wrapping the same text twice returns the cached lines."""
+        wrap_text.cache_clear()
+        lines = wrap_text("a long biography to wrap", 10)
+        assert wrap_text("a long biography to wrap", 10) is lines
+        assert wrap_text.cache_info().hits == 1
+        assert wrap_text("a long biography to wrap", 12) is not lines
+
+
+class TestSectionedContentPanel:
+    """Test cases for table-driven section layout."""
+
+    class SamplePanel(SectionedContentPanel):
+        """Panel with one keyed, one whole-enrichment and one styled section."""
+
+        TITLE = "Sample"
+        NO_DATA_TEXT = "Nothing here"
+        SECTIONS = (
+            SectionSpec("items", "Items:", (1, 1, 1), limit=2, formatter=lambda items: [str(i) for i in items], gap=0),
+            SectionSpec(None, "Derived:", (2, 2, 2), formatter=lambda e: ["yes"] if e.get("flag") else []),
+            SectionSpec("note", "Note:", (3, 3, 3), formatter=lambda note: [(note, (4, 4, 4), 40, 16)]),
+        )
+
+        def __init__(self):
+            """Initialize the sample panel."""
+            super().__init__(PanelInfo(id="sample", name="Sample", description="Sample", icon="S"))
+
+    def render_layout(self, enrichment):
+        """Render the sample panel and return (text, color, position) for each blit."""
+        panel = self.SamplePanel()
+        panel.update_context(ContentContext(artist="Artist", enrichment_data=enrichment))
+        surface = Mock()
+        with patch("pygame.font.Font") as mock_font:
+            mock_font.return_value.render.side_effect = lambda text, _aa, color: (text, color)
+            panel.render(surface, Mock(left=0, top=0))
+        return [(text, color, pos) for (text, color), pos in surface.blits.call_args[0][0]]
+
+    def test_sections_laid_out_in_order(self):
+        """Test limits, gaps and styled lines are applied while laying out sections."""
+        layout = self.render_layout({"items": [1, 2, 3], "flag": True, "note": "hi"})
+        assert layout == [
+            ("Sample", (120, 170, 255), (20, 10)),
+            ("Items:", (230, 230, 230), (20, 45)),
+            ("1", (1, 1, 1), (30, 65)),
+            ("2", (1, 1, 1), (30, 83)),
+            ("Derived:", (230, 230, 230), (20, 101)),
+            ("yes", (2, 2, 2), (30, 121)),
+            ("Note:", (230, 230, 230), (20, 149)),
+            ("hi", (4, 4, 4), (40, 169)),
+        ]
+
+    def test_empty_sections_and_missing_enrichment(self):
+        """Test sections without data are skipped and missing enrichment shows the placeholder."""
+        assert [text for text, _, _ in self.render_layout({"note": "hi"})] == ["Sample", "Note:", "hi"]
+        assert [text for text, _, _ in self.render_layout(None)] == ["Sample", "Nothing here"]
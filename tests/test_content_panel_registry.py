@@ -84,7 +84,6 @@ class TestContentPanelRegistry:
     def test_registry_initialization(self):
         """Test registry initialization."""
         assert len(self.registry._panels) == 0
-        assert len(self.registry._panel_order) == 0
         assert self.registry._live_context is None
         assert self.registry._held_context is None
 
@@ -94,7 +93,7 @@ class TestContentPanelRegistry:
 
         assert len(self.registry._panels) == 1
         assert self.registry._panels["panel1"] == self.panel1
-        assert self.registry._panel_order == ["panel1"]
+        assert self.registry.get_panel_ids() == ["panel1"]
 
     def test_register_multiple_panels(self):
         """Test registering multiple panels maintains order."""
@@ -102,7 +101,7 @@ class TestContentPanelRegistry:
         self.registry.register_panel(self.panel2)
 
         assert len(self.registry._panels) == 2
-        assert self.registry._panel_order == ["panel1", "panel2"]
+        assert self.registry.get_panel_ids() == ["panel1", "panel2"]
 
     def test_register_duplicate_panel_raises_error(self):
         """Test registering duplicate panel ID raises error."""
@@ -122,7 +121,7 @@ class TestContentPanelRegistry:
         assert result is True
         assert len(self.registry._panels) == 1
         assert "panel1" not in self.registry._panels
-        assert self.registry._panel_order == ["panel2"]
+        assert self.registry.get_panel_ids() == ["panel2"]
 
     def test_unregister_nonexistent_panel(self):
         """Test unregistering nonexistent panel returns False."""
@@ -151,7 +150,7 @@ class TestContentPanelRegistry:
 
         # Verify it's a copy (modifying doesn't affect registry)
         ids.append("test")
-        assert self.registry._panel_order == ["panel1", "panel2"]
+        assert self.registry.get_panel_ids() == ["panel1", "panel2"]
 
     def test_get_available_panels_all_enabled(self):
         """Test getting all available panels when enabled."""
@@ -164,6 +163,16 @@ class TestContentPanelRegistry:
         assert panels[0] == self.panel1  # Order preserved
         assert panels[1] == self.panel2
 
+    def test_get_available_panels_keeps_registration_order(self):
+        """Test that available panels follow registration order across unregister/re-register."""
+        self.registry.register_panel(self.panel1)
+        self.registry.register_panel(self.panel2)
+        self.registry.unregister_panel("panel1")
+        self.registry.register_panel(self.panel1)
+
+        assert self.registry.get_available_panels() == [self.panel2, self.panel1]
+        assert self.registry.get_panel_ids() == ["panel2", "panel1"]
+
     def test_get_available_panels_some_disabled(self):
         """Test getting available panels with some disabled."""
         self.panel2_info.enabled = False
@@ -286,6 +295,24 @@ class TestContentPanelRegistry:
         assert len(self.audio_panel.update_context_calls) == 1  # Gets live update
         assert self.audio_panel.update_context_calls[0] == live_context
 
+    def test_context_updates_use_hold_support_from_registration(self):
+        """Test that hold support is checked once per panel, at registration."""
+        self.registry.register_panel(self.panel1)
+        self.registry.register_panel(self.audio_panel)
+
+        with patch.object(self.panel1, "supports_hold", wraps=self.panel1.supports_hold) as spy:
+            self.registry.update_live_context(ContentContext(artist="Live"))
+            self.registry.set_held_context(ContentContext(artist="Held"))
+            self.registry.update_live_context(ContentContext(artist="Newer"))
+            spy.assert_not_called()
+
+        assert self.panel1._context.artist == "Held"
+        assert self.audio_panel._context.artist == "Newer"
+
+        self.registry.unregister_panel("audio_panel")
+        self.registry.update_live_context(ContentContext(artist="Latest"))
+        assert self.audio_panel._context.artist == "Newer"
+
     def test_release_held_context(self):
         """Test releasing held context returns to live updates."""
         self.registry.register_panel(self.panel1)
@@ -410,4 +437,26 @@ class TestContentPanelRegistry:
 
         # Modifying returned data shouldn't affect registry
         panel_order.append("test")
-        assert self.registry._panel_order == ["panel1"]
+        assert self.registry.get_panel_ids() == ["panel1"]
+
+    def test_version_changes_with_panels_and_context(self):
+        """Test that the registry version moves on every panel or context change."""
+        versions = [self.registry.version]
+
+        self.registry.register_panel(self.panel1)
+        versions.append(self.registry.version)
+        self.registry.update_live_context(ContentContext(artist="Artist"))
+        versions.append(self.registry.version)
+        self.registry.set_held_context(ContentContext(artist="Held"))
+        versions.append(self.registry.version)
+        self.registry.release_held_context()
+        versions.append(self.registry.version)
+        self.registry.unregister_panel("panel1")
+        versions.append(self.registry.version)
+
+        assert len(set(versions)) == len(versions)
+
+        # Lookups don't change the version
+        self.registry.get_registry_status()
+        self.registry.unregister_panel("missing")
+        assert self.registry.version == versions[-1]
@@ -9,6 +9,9 @@ This module tests the new enrichment panel implementations including:
 """
 
 import logging
+import os
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pygame
@@ -16,10 +19,33 @@ import pytest
 
 from nowplaying.enrichment import EnrichmentData
 from nowplaying.music_views import ContentContext
+from nowplaying.panels.album_enrichment_panel import AlbumEnrichmentPanel
+from nowplaying.panels.album_info_panel import AlbumInfoPanel
+from nowplaying.panels.artist_enrichment_panel import ArtistEnrichmentPanel
+from nowplaying.panels.artist_info_panel import ArtistInfoPanel
+from nowplaying.panels.cover_art_panel import CoverArtPanel
+from nowplaying.panels.debug_panel import DebugPanel, _count_set_fields
+from nowplaying.panels.discography_panel import DiscographyPanel, _group_releases
 from nowplaying.panels.discogs_panel import DiscogsPanel
 from nowplaying.panels.enrichment_log_buffer import EnrichmentLogBuffer
 from nowplaying.panels.lastfm_panel import LastFmPanel
 from nowplaying.panels.musicbrainz_panel import MusicBrainzPanel
+from nowplaying.panels.service_status_panel import ServiceStatusPanel
+from nowplaying.panels.social_stats_panel import SocialStatsPanel
+from nowplaying.panels.song_enrichment_panel import SongEnrichmentPanel
+from nowplaying.panels.vu_meter_panel import VUMeterPanel
+
+
+def _patch_font():
+    """Patch pygame.font.Font with a mock whose text always measures 100 x 16 pixels."""
+    return patch("pygame.font.Font", **{"return_value.size.return_value": (100, 16)})
+
+
+def _wait_for_cover_decode(panel, timeout=5.0):
+    """Wait for CoverArtPanel's worker threads to finish decoding."""
+    deadline = time.monotonic() + timeout
+    while panel._decoding and time.monotonic() < deadline:
+        time.sleep(0.01)
 
 
 class TestEnrichmentLogBuffer:
@@ -72,6 +98,23 @@ class TestEnrichmentLogBuffer:
         assert "Direct message 1" in lines[0]
         assert "Direct message 2" in lines[1]
 
+    def test_write_truncates_long_lines(self):
+        """Test that overlong lines are cut to max_line_length when captured."""
+        buffer = EnrichmentLogBuffer("test.truncate", max_lines=5, max_line_length=10)
+        buffer.write("x" * 25 + "\n")
+
+        assert buffer.get_lines() == ["x" * 10]
+
+    def test_get_tail(self):
+        """Test that get_tail returns only the most recent lines in order."""
+        buffer = EnrichmentLogBuffer("test.tail", max_lines=5)
+        for i in range(4):
+            buffer.write(f"Message {i}")
+
+        assert buffer.get_tail(2) == ["Message 2", "Message 3"]
+        assert buffer.get_tail(10) == buffer.get_lines()
+        assert buffer.get_tail(0) == []
+
 
 class TestEnrichmentPanels:
     """Test enrichment panel implementations."""
@@ -157,6 +200,7 @@ class TestEnrichmentPanels:
         with patch("pygame.font.Font") as mock_font:
             mock_text = Mock()
             mock_font.return_value.render.return_value = mock_text
+            mock_font.return_value.size.return_value = (100, 16)
 
             # Should not raise exception
             panel.render(mock_surface, mock_rect)
@@ -165,6 +209,441 @@ class TestEnrichmentPanels:
             mock_font.assert_called()
             mock_font.return_value.render.assert_called()
 
+    def test_album_enrichment_layout_built_once_per_enrichment(self, mock_surface, mock_rect, sample_context):
+        """Test that AlbumEnrichmentPanel lays out text once and rebuilds when enrichment arrives."""
+        panel = AlbumEnrichmentPanel()
+        panel.update_context(sample_context)
+
+        with patch("pygame.font.Font") as mock_font:
+            panel.render(mock_surface, mock_rect)
+            layout = panel._layout
+            panel.render(mock_surface, mock_rect)
+            assert panel._layout is layout
+            assert mock_surface.blits.call_count == 2
+            assert len(mock_surface.blits.call_args.args[0]) == 2  # Title and "no data" line
+
+            # Enrichment attached to the same context later
+            sample_context.enrichment_data = {
+                "musicbrainz_album_id": "album-id",
+                "album_credits": [{"role": "Producer", "artist": "Someone"}],
+            }
+            panel.render(mock_surface, mock_rect)
+
+        assert panel._layout is not layout
+        rendered = [call.args[0] for call in mock_font.return_value.render.call_args_list]
+        assert "album-id" in rendered
+        assert "Producer: Someone" in rendered
+        assert mock_surface.blits.call_args.args[0][-1] == (mock_font.return_value.render.return_value, (40, 113))
+
+    @pytest.mark.parametrize(
+        "panel_class", [AlbumEnrichmentPanel, AlbumInfoPanel, ArtistEnrichmentPanel, ArtistInfoPanel]
+    )
+    def test_info_panels_rebuild_layout_only_when_inputs_change(
+        self, panel_class, mock_surface, mock_rect, sample_context
+    ):
+        """Test that the blit sequence is reused until enrichment, position or context change."""
+        panel = panel_class()
+        panel.update_context(sample_context)
+
+        with patch("pygame.font.Font"), patch.object(
+            panel_class, "_build_layout", autospec=True, side_effect=panel_class._build_layout
+        ) as spy:
+            panel.render(mock_surface, mock_rect)
+            panel.render(mock_surface, mock_rect)
+            assert spy.call_count == 1
+
+            sample_context.enrichment_data = {"artist_tags": ["rock"], "album_credits": [{"role": "Producer"}]}
+            panel.render(mock_surface, mock_rect)
+            assert spy.call_count == 2
+
+            panel.render(mock_surface, pygame.Rect(0, 0, 400, 300))
+            assert spy.call_count == 3
+
+            panel.update_context(sample_context)
+            panel.render(mock_surface, pygame.Rect(0, 0, 400, 300))
+            assert spy.call_count == 4
+
+        # Each frame is drawn with one batched blit
+        assert mock_surface.blits.call_count == 5
+        mock_surface.blit.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "panel_class", [AlbumEnrichmentPanel, AlbumInfoPanel, ArtistEnrichmentPanel, ArtistInfoPanel]
+    )
+    def test_sectioned_panels_use_slots(self, panel_class):
+        """Test that sectioned panel state lives in slots rather than an instance dict."""
+        panel = panel_class()
+        assert not hasattr(panel, "__dict__")
+        with pytest.raises(AttributeError):
+            panel.unexpected_attribute = True
+
+    @pytest.mark.parametrize(
+        "panel_class", [AlbumInfoPanel, CoverArtPanel, DebugPanel, DiscographyPanel, DiscogsPanel]
+    )
+    def test_panels_skip_render_outside_clip(self, panel_class, mock_surface, sample_context):
+        """Test that a panel whose rect lies outside the clip area draws nothing."""
+        panel = panel_class()
+        panel.update_context(sample_context)
+        mock_surface.get_clip.return_value = pygame.Rect(500, 500, 100, 100)
+
+        with patch("pygame.font.Font") as mock_font, patch("pygame.draw.rect") as draw_rect:
+            panel.render(mock_surface, pygame.Rect(0, 0, 400, 300))
+
+        mock_font.assert_not_called()
+        draw_rect.assert_not_called()
+        mock_surface.blit.assert_not_called()
+        mock_surface.blits.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "panel_class",
+        [
+            AlbumEnrichmentPanel,
+            AlbumInfoPanel,
+            ArtistEnrichmentPanel,
+            ArtistInfoPanel,
+            CoverArtPanel,
+            DebugPanel,
+            DiscographyPanel,
+            DiscogsPanel,
+            LastFmPanel,
+            MusicBrainzPanel,
+            ServiceStatusPanel,
+            SocialStatsPanel,
+            SongEnrichmentPanel,
+            VUMeterPanel,
+        ],
+    )
+    def test_panels_reuse_fonts_and_text_across_renders(self, panel_class, mock_surface, sample_context):
+        """Test that fonts and unchanged text are rendered on the first frame only."""
+        panel = panel_class()
+        panel.update_context(sample_context)
+        rect = pygame.Rect(0, 0, 400, 300)
+
+        with _patch_font() as mock_font, patch("pygame.draw.rect"):
+            panel.render(mock_surface, rect)
+            fonts_created = mock_font.call_count
+            text_rendered = mock_font.return_value.render.call_count
+            panel.render(mock_surface, rect)
+
+        assert fonts_created >= 1
+        assert mock_font.call_count == fonts_created
+        assert mock_font.return_value.render.call_count == text_rendered
+
+    @pytest.mark.parametrize(
+        "panel_class",
+        [
+            DebugPanel,
+            DiscographyPanel,
+            DiscogsPanel,
+            LastFmPanel,
+            MusicBrainzPanel,
+            ServiceStatusPanel,
+            SocialStatsPanel,
+            SongEnrichmentPanel,
+        ],
+    )
+    def test_text_panels_draw_with_one_blits_call(self, panel_class, mock_surface, sample_context):
+        """Test that each frame's text is drawn with a single batched blit."""
+        panel = panel_class()
+        panel.update_context(sample_context)
+
+        with _patch_font():
+            panel.render(mock_surface, pygame.Rect(0, 0, 400, 300))
+
+        mock_surface.blits.assert_called_once()
+        assert mock_surface.blits.call_args.args[0]
+        mock_surface.blit.assert_not_called()
+
+    def test_debug_panel_rebuilds_only_when_dirty(self, mock_surface, sample_context):
+        """Test that DebugPanel reuses its blit sequence until context, scroll or rect change."""
+        panel = DebugPanel()
+        panel.update_context(sample_context)
+        rect = pygame.Rect(0, 0, 400, 300)
+
+        with patch("pygame.font.Font"), patch.object(
+            DebugPanel, "_build_blits", autospec=True, side_effect=DebugPanel._build_blits
+        ) as spy:
+            panel.render(mock_surface, rect)
+            panel.render(mock_surface, rect)
+            assert spy.call_count == 1
+
+            panel.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN))
+            panel.render(mock_surface, rect)
+            assert spy.call_count == 2
+
+            panel.render(mock_surface, pygame.Rect(0, 0, 640, 480))
+            assert spy.call_count == 3
+
+            panel.update_context(sample_context)
+            panel.render(mock_surface, pygame.Rect(0, 0, 640, 480))
+            assert spy.call_count == 4
+
+        assert mock_surface.blits.call_count == 5
+
+    def test_debug_panel_formats_lines_once_per_context(self, mock_surface, sample_context):
+        """Test that scrolling and resizing re-slice the debug lines instead of formatting them again."""
+        panel = DebugPanel()
+        panel.update_context(sample_context)
+        rect = pygame.Rect(0, 0, 400, 300)
+
+        with patch("pygame.font.Font"), patch.object(
+            DebugPanel, "_build_lines", autospec=True, side_effect=DebugPanel._build_lines
+        ) as spy:
+            panel.render(mock_surface, rect)
+            panel.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN))
+            panel.render(mock_surface, rect)
+            panel.render(mock_surface, pygame.Rect(0, 0, 640, 480))
+            assert spy.call_count == 1
+
+            panel.update_context(sample_context)
+            panel.render(mock_surface, rect)
+            assert spy.call_count == 2
+
+    def test_discography_grouping_is_sorted(self):
+        """Test releases are grouped by type name and listed most recent year first."""
+        grouped = _group_releases(
+            [
+                {"title": "B", "format": "Single", "year": 2001},
+                {"title": "A", "format": "Album", "year": 1999},
+                {"title": "C", "format": "Album", "year": 2005},
+                "not a release",
+            ]
+        )
+        assert [release_type for release_type, _ in grouped] == ["Album", "Single"]
+        assert [year for year, _ in grouped[0][1]] == [2005, 1999]
+
+    def test_discography_panel_groups_releases_once(self, mock_surface, sample_context):
+        """Test that DiscographyPanel regroups only when the discography list is replaced."""
+        panel = DiscographyPanel()
+        sample_context.enrichment_data = {"artist_discography": [{"title": "A", "year": 1999}]}
+        panel.update_context(sample_context)
+        rect = pygame.Rect(0, 0, 400, 300)
+
+        with patch("pygame.font.Font"), patch(
+            "nowplaying.panels.discography_panel._group_releases", side_effect=_group_releases
+        ) as spy:
+            panel.render(mock_surface, rect)
+            panel.render(mock_surface, rect)
+            assert spy.call_count == 0
+
+            sample_context.enrichment_data = {"artist_discography": [{"title": "B", "year": 2001}]}
+            panel.render(mock_surface, rect)
+            panel.render(mock_surface, rect)
+            assert spy.call_count == 1
+
+    def test_debug_panel_scroll_clamped_to_context_limit(self, sample_context):
+        """Test that keyboard scrolling stops at the limit computed for the context."""
+        panel = DebugPanel()
+        panel.update_context(sample_context)
+        for _ in range(30):
+            panel.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN))
+        assert panel._scroll_offset == 21
+
+    def test_service_status_completeness_counted_once_per_enrichment(self):
+        """Test that data completeness is recounted only when the enrichment object is replaced."""
+        panel = ServiceStatusPanel()
+        enrichment = {"artist_bio": "Bio", "scrobble_count": 0}
+        assert panel._get_completeness(enrichment) == (2, 10)
+
+        enrichment["artist_tags"] = ["rock"]  # Same object: cached counts
+        assert panel._get_completeness(enrichment) == (2, 10)
+        assert panel._get_completeness(dict(enrichment)) == (3, 10)
+
+    def test_log_panel_truncates_to_column_width(self):
+        """Test that long field lines are cut to the column width and short ones are not measured."""
+        panel = MusicBrainzPanel()
+        font = Mock()
+        font.size.side_effect = lambda text: (len(text) * 10, 16)
+
+        with patch.object(panel, "_get_font", return_value=font):
+            assert panel._truncate_to_width("Short", 24, 200) == "Short"
+            font.size.assert_called_once_with("M")  # Fits by the estimate alone
+            assert panel._truncate_to_width("x" * 30, 24, 200) == "x" * 17 + "..."
+
+    def test_debug_panel_counts_set_fields(self):
+        """Test the metadata field count skips None, False, zeros and empty strings."""
+        context = ContentContext(artist="Artist", duration=0.0, enrichment_data={})
+        # artist, enrichment_data, playback_state and source hold values
+        assert _count_set_fields(context) == 4
+        assert _count_set_fields(context) == len([v for v in vars(context).values() if v not in (None, "", False)])
+
+    @pytest.mark.parametrize("panel_class", [DiscogsPanel, LastFmPanel, MusicBrainzPanel])
+    def test_log_panels_rebuild_when_log_changes(self, panel_class, mock_surface, sample_context):
+        """Test that the log panels redraw only after new log lines arrive or the context changes."""
+        panel = panel_class()
+        panel.update_context(sample_context)
+        rect = pygame.Rect(0, 0, 400, 300)
+
+        with _patch_font(), patch.object(
+            panel_class, "_build_blits", autospec=True, side_effect=panel_class._build_blits
+        ) as spy:
+            panel.render(mock_surface, rect)
+            panel.render(mock_surface, rect)
+            assert spy.call_count == 1
+
+            panel.log_buffer.write("Looking up release")
+            panel.render(mock_surface, rect)
+            assert spy.call_count == 2
+
+            panel.update_context(sample_context)
+            panel.render(mock_surface, rect)
+            assert spy.call_count == 3
+
+    def test_cover_art_decoded_once_and_scaled_per_size(self, tmp_path):
+        """Test that resizing rescales the decoded cover without reloading the file."""
+        cover_path = tmp_path / "cover.png"
+        pygame.image.save(pygame.Surface((64, 64)), str(cover_path))
+        panel = CoverArtPanel()
+        surface = pygame.Surface((400, 300))
+        small, large = pygame.Rect(0, 0, 200, 150), pygame.Rect(0, 0, 400, 300)
+
+        with patch("pygame.image.load", wraps=pygame.image.load) as load, patch(
+            "pygame.transform.smoothscale", wraps=pygame.transform.smoothscale
+        ) as smoothscale:
+            panel.update_context(ContentContext(album="Album", cover_art_path=str(cover_path)))
+            _wait_for_cover_decode(panel)
+            for rect in (small, large, small, large):
+                panel.render(surface, rect)
+
+        assert load.call_count == 1
+        assert [call.args[1] for call in smoothscale.call_args_list] == [(118, 118), (268, 268)]
+
+    def test_cover_art_checks_file_once_per_context(self, tmp_path):
+        """Test that the cover file's existence is checked on context updates, not per frame."""
+        cover_path = tmp_path / "cover.png"
+        pygame.image.save(pygame.Surface((64, 64)), str(cover_path))
+        panel = CoverArtPanel()
+        surface = pygame.Surface((400, 300))
+
+        with patch("os.path.isfile", wraps=os.path.isfile) as isfile:
+            panel.update_context(ContentContext(album="Album", cover_art_path=str(cover_path)))
+            _wait_for_cover_decode(panel)
+            for _ in range(3):
+                panel.render(surface, surface.get_rect())
+            assert isfile.call_count == 1
+
+            panel.update_context(ContentContext(album="Album", cover_art_path=str(tmp_path / "missing.png")))
+            assert isfile.call_count == 2
+        assert not panel._cover_path_exists
+
+    def test_cover_art_shows_placeholder_while_decoding(self, tmp_path):
+        """Test that render draws a loading placeholder instead of blocking on the decode."""
+        cover_path = tmp_path / "cover.png"
+        pygame.image.save(pygame.Surface((64, 64)), str(cover_path))
+        panel = CoverArtPanel()
+        surface = pygame.Surface((400, 300))
+        release = threading.Event()
+        real_load = pygame.image.load
+
+        def slow_load(path):
+            release.wait(5)
+            return real_load(path)
+
+        with patch("pygame.image.load", side_effect=slow_load), patch.object(
+            panel, "_render_text", return_value=pygame.Surface((10, 10))
+        ) as render_text:
+            panel.update_context(ContentContext(album="Album", cover_art_path=str(cover_path)))
+            panel.render(surface, surface.get_rect())
+            render_text.assert_called_once_with("Loading cover art...", 24, (170, 170, 170))
+
+            release.set()
+            _wait_for_cover_decode(panel)
+            panel.render(surface, surface.get_rect())
+        assert render_text.call_count == 1
+        assert panel._cover_image is not None
+
+    def test_cover_art_current_decode_survives_late_decodes(self, tmp_path):
+        """Test that decodes finishing after the current one can't evict the current cover."""
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.png"
+            pygame.image.save(pygame.Surface((64, 64)), str(path))
+            paths.append(str(path))
+        releases = {path: threading.Event() for path in paths}
+        real_load = pygame.image.load
+        panel = CoverArtPanel()
+
+        def slow_load(path):
+            releases[path].wait(5)
+            return real_load(path)
+
+        with patch("pygame.image.load", side_effect=slow_load):
+            threads = []
+            for path in paths:
+                with patch("threading.Thread.start", autospec=True, side_effect=threading.Thread.start) as start:
+                    panel.update_context(ContentContext(album="Album", cover_art_path=path))
+                threads.append(start.call_args.args[0])
+            for path, thread in reversed(list(zip(paths, threads))):
+                releases[path].set()
+                thread.join()
+
+        assert panel._get_scaled_cover(400, 300) is not None
+
+    def test_cover_art_decodes_file_written_after_first_context(self, tmp_path):
+        """Test that a cover file appearing after its path was first seen is still decoded."""
+        cover_path = tmp_path / "cover.png"
+        panel = CoverArtPanel()
+        context = ContentContext(album="Album", cover_art_path=str(cover_path))
+
+        panel.update_context(context)
+        assert panel._get_scaled_cover(400, 300) is None
+
+        pygame.image.save(pygame.Surface((64, 64)), str(cover_path))
+        panel.update_context(context)
+        _wait_for_cover_decode(panel)
+        assert panel._get_scaled_cover(400, 300) is not None
+
+    def test_cover_art_retries_failed_decode_on_context_update(self, tmp_path):
+        """Test that a cover which failed to decode is retried once the file is replaced."""
+        cover_path = tmp_path / "cover.png"
+        cover_path.write_bytes(b"not an image")
+        panel = CoverArtPanel()
+        context = ContentContext(album="Album", cover_art_path=str(cover_path))
+
+        panel.update_context(context)
+        _wait_for_cover_decode(panel)
+        assert panel._get_scaled_cover(400, 300) is None
+
+        pygame.image.save(pygame.Surface((64, 64)), str(cover_path))
+        panel.update_context(context)
+        _wait_for_cover_decode(panel)
+        assert panel._get_scaled_cover(400, 300) is not None
+
+    def test_cover_art_unreadable_file_is_loaded_once(self, tmp_path):
+        """Test that a cover that fails to decode is not retried on later frames."""
+        cover_path = tmp_path / "cover.png"
+        cover_path.write_bytes(b"not an image")
+        panel = CoverArtPanel()
+        surface = pygame.Surface((400, 300))
+
+        with patch("pygame.image.load", wraps=pygame.image.load) as load, patch.object(
+            panel, "_render_text", return_value=pygame.Surface((10, 10))
+        ) as render_text:
+            panel.update_context(ContentContext(album="Album", cover_art_path=str(cover_path)))
+            _wait_for_cover_decode(panel)
+            for _ in range(3):
+                panel.render(surface, surface.get_rect())
+
+        assert load.call_count == 1
+        render_text.assert_called_with("No cover art", 24, (170, 170, 170))
+
+    def test_cover_art_converted_to_display_format(self, tmp_path):
+        """Test that scaled covers are converted to the display's pixel format once a display is set."""
+        cover_path = tmp_path / "cover.png"
+        pygame.image.save(pygame.Surface((264, 264)), str(cover_path))
+        panel = CoverArtPanel()
+        panel.update_context(ContentContext(album="Album", cover_art_path=str(cover_path)))
+        _wait_for_cover_decode(panel)
+
+        with patch("pygame.display.get_surface", return_value=None):
+            assert panel._get_scaled_cover(150, 150).get_size() == (118, 118)
+
+        with patch("pygame.transform.smoothscale", return_value=Mock(get_flags=Mock(return_value=0))) as smooth, patch(
+            "pygame.display.get_surface", return_value=Mock()
+        ):
+            assert panel._get_scaled_cover(200, 200) is smooth.return_value.convert.return_value
+        smooth.return_value.convert.assert_called_once_with()
+
     def test_handle_event_noop(self):
         """Test that handle_event returns False (no-op)."""
         panel = MusicBrainzPanel()
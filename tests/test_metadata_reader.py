@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from nowplaying.metadata_monitor import ShairportSyncPipeReader
+from nowplaying.metadata_reader import cover_art_writer
 from nowplaying.playback_state import PlaybackState
 
 
@@ -182,11 +183,11 @@ class TestShairportSyncPipeReader:
         pict_data = base64.b64encode(image_data).decode()
         pict_xml = f'<item><type>73736e63</type><code>50494354</code><length>{len(image_data)}</length><data encoding="base64">{pict_data}</data></item>'
 
-        with patch("builtins.open", create=True) as mock_open:
-            mock_file = Mock()
-            mock_open.return_value.__enter__.return_value = mock_file
+        with patch.object(cover_art_writer, "_write_file") as mock_write:
 
             self.reader.process_line(pict_xml)
+            self.reader.flush_cover_art()
+            mock_write.assert_called_once()
 
         # Should not trigger state callback but should call metadata callback with cover art path
         self.state_callback.assert_not_called()
@@ -346,7 +347,7 @@ class TestShairportSyncPipeReader:
         # Verify state is reset
         assert self.reader._current_item is None
         assert not self.reader._collecting_data
-        assert self.reader._data_buffer == ""
+        assert self.reader._data_length == 0
 
         # Process another item to ensure clean state
         lines2 = [
@@ -362,6 +363,29 @@ class TestShairportSyncPipeReader:
         # Should work correctly
         assert self.reader._current_metadata.get("artist") == "Artist"
 
+    def test_data_buffer_reused_across_items(self):
+        """Test that a shorter item after a longer one only decodes its own data."""
+        long_data = base64.b64encode(b"A much longer album title").decode()
+        lines = [
+            "<item><type>636f7265</type><code>6173616c</code><length>25</length>",
+            '<data encoding="base64">',
+            long_data[:16],
+            long_data[16:],
+            "</data></item>",
+        ]
+        for line in lines:
+            self.reader.process_line(line)
+        buffer = self.reader._data_buffer
+
+        short_data = base64.b64encode(b"Short").decode()
+        self.reader.process_line(
+            f'<item><type>636f7265</type><code>61736172</code><length>5</length><data encoding="base64">{short_data}</data></item>'
+        )
+
+        assert self.reader._current_metadata["album"] == "A much longer album title"
+        assert self.reader._current_metadata["artist"] == "Short"
+        assert self.reader._data_buffer is buffer
+
     def test_metadata_id_always_present(self):
         """Test that metadata_id is always present and is a valid UUID."""
         import uuid
@@ -10,6 +10,7 @@ This module tests the module registry system including:
 """
 
 import logging
+import sys
 
 from nowplaying.module_registry import ModuleRegistry
 
@@ -209,6 +210,70 @@ class TestModuleRegistry:
         assert "feature1" in feature_modules
         assert len(empty_modules) == 0
 
+    def test_indices_follow_reregistration_and_toggling(self):
+        """Test that category/enabled indices stay in sync with module changes."""
+        self.registry.register_module(
+            name="module1",
+            description="Module 1",
+            logger_name="test.module1",
+            debug_flag="--debug-mod1",
+            category="core",
+        )
+        self.registry.register_module(
+            name="module1",
+            description="Module 1 moved",
+            logger_name="test.module1",
+            debug_flag="--debug-mod1",
+            enabled=False,
+            category="feature",
+        )
+
+        assert self.registry.get_modules_by_category("core") == {}
+        assert list(self.registry.get_modules_by_category("feature")) == ["module1"]
+        assert self.registry.get_enabled_modules() == {}
+
+        self.registry.enable_module("module1")
+        assert list(self.registry.get_enabled_modules()) == ["module1"]
+
+    def test_indices_keep_registration_order(self):
+        """Test that filtered queries list modules in registration order."""
+        names = ["gamma", "alpha", "epsilon", "beta", "delta"]
+        for name in names:
+            self.registry.register_module(
+                name=name,
+                description=name,
+                logger_name=f"test.{name}",
+                debug_flag=f"--debug-{name}",
+                category="core",
+            )
+
+        self.registry.disable_module("alpha")
+        self.registry.enable_module("alpha")
+        self.registry.register_module(
+            name="beta", description="beta", logger_name="test.beta", debug_flag="--debug-beta", category="other"
+        )
+        self.registry.register_module(
+            name="beta", description="beta", logger_name="test.beta", debug_flag="--debug-beta", category="core"
+        )
+
+        assert list(self.registry.get_enabled_modules()) == names
+        assert list(self.registry.get_modules_by_category("core")) == names
+
+    def test_register_module_interns_identifiers(self):
+        """Test that module names, logger names, flags and categories are interned."""
+        name = "".join(["interned", "_module"])
+        category = "".join(["cat", "egory"])
+        self.registry.register_module(
+            name=name,
+            description="Interned module",
+            logger_name="test.interned",
+            debug_flag="--debug-interned",
+            category=category,
+        )
+
+        assert next(iter(self.registry.get_module_names())) is sys.intern("interned_module")
+        assert self.registry.get_module_info(name)["category"] is sys.intern("category")
+
     def test_get_all_modules(self):
         """Test getting all modules returns copy."""
         self.registry.register_module(
@@ -345,6 +410,31 @@ class TestModuleRegistry:
         assert isinstance(categories, set)
         assert categories == {"core", "feature"}
 
+    def test_derived_views_cached_until_registration(self):
+        """Test that logger/flag/category views are reused until a module is registered."""
+        self.registry.register_module(
+            name="module1",
+            description="Module 1",
+            logger_name="test.logger1",
+            debug_flag="--debug-mod1",
+        )
+
+        logger_names = self.registry.get_debug_logger_names()
+        assert self.registry.get_debug_logger_names() is logger_names
+        assert self.registry.get_debug_flags() is self.registry.get_debug_flags()
+
+        self.registry.register_module(
+            name="module2",
+            description="Module 2",
+            logger_name="test.logger2",
+            debug_flag="--debug-mod2",
+            category="core",
+        )
+
+        assert self.registry.get_debug_logger_names() == {"test.logger1", "test.logger2"}
+        assert self.registry.get_debug_flags()["--debug-mod2"] == "module2"
+        assert self.registry.get_categories() == {"feature", "core"}
+
     def test_logger_creation(self):
         """Test that loggers are properly created."""
         self.registry.register_module(
@@ -0,0 +1,269 @@
+"""
+Tests for PanelNavigator.
+
+This module tests panel navigation including:
+- Panel availability and direct navigation
+- Keyboard and swipe navigation
+- Hold/release of the exploration context
+"""
+
+from unittest.mock import Mock, patch
+
+import pygame
+import pytest
+
+from nowplaying import panel_navigator
+from nowplaying.panel_navigator import PanelNavigator
+from nowplaying.panels.base import ContentContext, ContentPanel, ContentPanelRegistry, PanelInfo
+
+
+class MockContentPanel(ContentPanel):
+    """Minimal panel for navigation tests."""
+
+    def render(self, surface, rect) -> None:  # noqa: U100
+        """Mock render method."""
+        pass
+
+
+def make_panel(panel_id: str, **info_kwargs) -> MockContentPanel:
+    """Create a mock panel with the given id."""
+    return MockContentPanel(
+        PanelInfo(id=panel_id, name=panel_id.title(), description=f"{panel_id} panel", icon="🎵", **info_kwargs)
+    )
+
+
+class TestPanelNavigator:
+    """Tests for PanelNavigator."""
+
+    def setup_method(self):
+        """Set up a navigator with its own registry and three panels."""
+        self.registry = ContentPanelRegistry()
+        for panel_id in ("first", "second", "third"):
+            self.registry.register_panel(make_panel(panel_id))
+
+        self.navigator = PanelNavigator()
+        self.navigator.registry = self.registry
+        self.navigator.update_available_panels()
+
+    def test_navigate_to_panel(self):
+        """Test direct navigation by panel id."""
+        assert self.navigator.navigate_to_panel("third") is True
+        assert self.navigator.get_current_panel().info.id == "third"
+
+        assert self.navigator.navigate_to_panel("missing") is False
+        assert self.navigator.get_current_panel().info.id == "third"
+
+    def test_navigate_to_panel_follows_availability(self):
+        """Test that direct navigation only reaches panels available for the context."""
+        self.registry.register_panel(make_panel("art", requires_cover_art=True))
+
+        self.navigator.update_available_panels(ContentContext(artist="Artist"))
+        assert self.navigator.navigate_to_panel("art") is False
+
+        self.navigator.update_available_panels(ContentContext(artist="Artist", cover_art_path="/tmp/cover.jpg"))
+        assert self.navigator.navigate_to_panel("art") is True
+        assert self.navigator.get_panel_info()["current_index"] == 3
+
+    def test_navigate_left_right_bounds(self):
+        """Test that left/right navigation stops at the ends."""
+        assert self.navigator.navigate_left() is False
+        assert self.navigator.navigate_right() is True
+        assert self.navigator.navigate_right() is True
+        assert self.navigator.navigate_right() is False
+        assert self.navigator.get_current_panel().info.id == "third"
+
+    def test_panel_info_cached_until_state_changes(self):
+        """Test that panel info is reused until navigation or hold state changes."""
+        info = self.navigator.get_panel_info()
+        assert self.navigator.get_panel_info() is info
+        assert info["current_panel_id"] == "first"
+        assert info["can_swipe_left"] is False
+
+        self.navigator.navigate_right()
+        info = self.navigator.get_panel_info()
+        assert info["current_panel_id"] == "second"
+        assert info["can_swipe_left"] is True
+
+        self.registry.update_live_context(ContentContext(artist="Artist"))
+        assert self.navigator._hold_current_context() is True
+        assert self.navigator.get_panel_info()["has_held_context"] is True
+
+        assert self.navigator._release_held_context() is True
+        assert self.navigator.get_panel_info()["has_held_context"] is False
+
+        # Hold state changed directly on the registry is picked up through its version
+        self.registry.set_held_context(ContentContext(artist="Artist"))
+        assert self.navigator.get_panel_info()["has_held_context"] is True
+        self.registry.release_held_context()
+        assert self.navigator.get_panel_info()["has_held_context"] is False
+
+    def test_navigation_hints_rendered_once_per_string(self):
+        """Test that the hint font is created once and hint surfaces are reused."""
+        surface = Mock()
+        rect = pygame.Rect(0, 0, 320, 240)
+
+        with patch("pygame.font.Font") as mock_font:
+            self.navigator.render_navigation_hints(surface, rect)
+            with patch.object(PanelNavigator, "_build_hint_lines") as mock_build:
+                self.navigator.render_navigation_hints(surface, rect)
+                mock_build.assert_not_called()
+
+            mock_font.assert_called_once_with(None, 16)
+            # Panel indicator and hint line, each rasterized once
+            assert mock_font.return_value.render.call_count == 2
+            assert surface.blit.call_count == 4
+
+            self.navigator.navigate_right()
+            self.navigator.render_navigation_hints(surface, rect)
+            assert mock_font.return_value.render.call_count == 4
+
+    def test_live_context_refreshes_panels_on_significant_change(self):
+        """Test that panel availability is refreshed only when key context fields change."""
+        self.registry.register_panel(make_panel("art", requires_cover_art=True))
+
+        with patch.object(
+            PanelNavigator, "update_available_panels", autospec=True, side_effect=PanelNavigator.update_available_panels
+        ) as spy:
+            self.navigator.update_live_context(ContentContext(artist="Artist", title="Song 1"))
+            self.navigator.update_live_context(ContentContext(artist="Artist", title="Song 2"))
+            assert spy.call_count == 1
+            assert self.navigator.navigate_to_panel("art") is False
+
+            self.navigator.update_live_context(ContentContext(artist="Artist", cover_art_path="/tmp/cover.jpg"))
+            assert spy.call_count == 2
+            assert self.navigator.navigate_to_panel("art") is True
+
+    def test_live_context_keeps_current_panel_when_availability_changes(self):
+        """Test that a track change removing an earlier panel leaves the user on the same panel."""
+        registry = ContentPanelRegistry()
+        for panel in (make_panel("first"), make_panel("art", requires_cover_art=True), make_panel("third")):
+            registry.register_panel(panel)
+        self.navigator.registry = registry
+
+        self.navigator.update_live_context(ContentContext(artist="Artist", cover_art_path="/tmp/cover.jpg"))
+        assert self.navigator.navigate_to_panel("third") is True
+        assert self.navigator.get_panel_info()["current_index"] == 2
+
+        # The next track has no cover art, so the panel before the current one disappears
+        self.navigator.update_live_context(ContentContext(artist="Other Artist"))
+        assert self.navigator.get_current_panel().info.id == "third"
+        assert self.navigator.get_panel_info()["current_index"] == 1
+
+        # A panel that is no longer available falls back to a clamped index
+        self.navigator.update_live_context(ContentContext(artist="Artist", cover_art_path="/tmp/cover.jpg"))
+        assert self.navigator.navigate_to_panel("art") is True
+        self.navigator.update_live_context(ContentContext(artist="Other Artist"))
+        assert self.navigator.get_current_panel().info.id == "third"
+
+    def test_keyboard_navigation(self):
+        """Test key bindings for navigation and hold/release."""
+        self.registry.update_live_context(ContentContext(artist="Artist"))
+
+        assert self.navigator.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)) is True
+        assert self.navigator.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_d)) is True
+        assert self.navigator.get_current_panel().info.id == "third"
+        assert self.navigator.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)) is True
+        assert self.navigator.get_current_panel().info.id == "second"
+
+        assert self.navigator.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)) is True
+        assert self.registry.has_held_context()
+        assert self.navigator.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r)) is True
+        assert not self.registry.has_held_context()
+
+        assert self.navigator.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_x)) is False
+        assert self.navigator.handle_event(pygame.event.Event(pygame.USEREVENT)) is False
+
+    def test_mouse_swipe_navigation(self):
+        """Test horizontal mouse swipes move between panels."""
+        down = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(200, 100))
+        up = pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=(100, 110))
+
+        assert self.navigator.handle_event(down) is True
+        assert self.navigator.handle_event(up) is True
+        assert self.navigator.get_current_panel().info.id == "second"
+
+        # Right button does not start a swipe
+        assert self.navigator.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=3, pos=(0, 0))) is False
+
+    def test_touch_swipe_uses_cached_surface_size(self):
+        """Test finger events scale by a display size cached until resize."""
+        if not panel_navigator._HAS_FINGER:
+            pytest.skip("pygame build lacks touch events")
+        surface = Mock()
+        surface.get_size.return_value = (400, 200)
+        with patch("pygame.display.get_surface", return_value=surface):
+            self.navigator.handle_event(pygame.event.Event(pygame.FINGERDOWN, x=0.5, y=0.5))
+            self.navigator.handle_event(pygame.event.Event(pygame.FINGERUP, x=0.1, y=0.5))
+            assert surface.get_size.call_count == 1
+            assert self.navigator.get_current_panel().info.id == "second"
+
+            resize = pygame.event.Event(pygame.VIDEORESIZE, w=800, h=400, size=(800, 400))
+            assert self.navigator.handle_event(resize) is False
+            self.navigator.handle_event(pygame.event.Event(pygame.FINGERDOWN, x=0.5, y=0.5))
+            assert surface.get_size.call_count == 2
+
+    def test_swipe_gesture_classification(self):
+        """Test each swipe direction maps to its action and short/diagonal swipes are ignored."""
+        self.registry.update_live_context(ContentContext(artist="Artist"))
+
+        def swipe(start, end):
+            self.navigator._swipe_start_pos = start
+            self.navigator._handle_swipe_end(end)
+
+        swipe((200, 100), (100, 100))  # Left
+        assert self.navigator.get_current_panel().info.id == "second"
+        swipe((100, 100), (200, 100))  # Right
+        assert self.navigator.get_current_panel().info.id == "first"
+        swipe((100, 200), (100, 100))  # Up
+        assert self.registry.has_held_context()
+        swipe((100, 100), (100, 200))  # Down
+        assert not self.registry.has_held_context()
+
+        swipe((100, 100), (130, 100))  # Below threshold
+        swipe((100, 100), (0, 0))  # Diagonal
+        assert self.navigator.get_current_panel().info.id == "first"
+
+    def test_navigation_status_reuses_registry_status(self):
+        """Test that registry status is only rebuilt after the registry changes."""
+        with patch.object(self.registry, "get_registry_status", wraps=self.registry.get_registry_status) as spy:
+            first = self.navigator.get_navigation_status()
+            second = self.navigator.get_navigation_status()
+            assert spy.call_count == 1
+            assert second["registry_status"] is first["registry_status"]
+
+            self.registry.update_live_context(ContentContext(artist="Artist"))
+            status = self.navigator.get_navigation_status()
+            assert spy.call_count == 2
+            assert status["registry_status"]["live_artist"] == "Artist"
+
+    def test_handle_events_skips_unhandled_types(self):
+        """Test batched event handling only dispatches input events."""
+        events = [
+            pygame.event.Event(pygame.TEXTINPUT, text="d"),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT),
+            pygame.event.Event(pygame.USEREVENT),
+        ]
+        with patch.object(
+            PanelNavigator, "handle_event", autospec=True, side_effect=PanelNavigator.handle_event
+        ) as spy:
+            self.navigator.handle_events(events)
+
+        spy.assert_called_once_with(self.navigator, events[1])
+        assert self.navigator.get_current_panel().info.id == "second"
+
+    def test_set_display_size_scales_touch_without_querying_display(self):
+        """Test that a display size set by the app is used for touch scaling."""
+        if not panel_navigator._HAS_FINGER:
+            pytest.skip("pygame build lacks touch events")
+        self.navigator.set_display_size(400, 200)
+        with patch("pygame.display.get_surface") as mock_get_surface:
+            self.navigator.handle_event(pygame.event.Event(pygame.FINGERDOWN, x=0.5, y=0.5))
+
+        mock_get_surface.assert_not_called()
+        assert self.navigator._swipe_start_pos == (200.0, 100.0)
+
+    def test_navigator_uses_slots(self):
+        """Test that navigator state lives in slots rather than an instance dict."""
+        assert not hasattr(self.navigator, "__dict__")
+        with pytest.raises(AttributeError):
+            self.navigator.unexpected_attribute = True
@@ -9,3 +9,17 @@ def test_panels_basic_smoke():
     """Basic smoke test ensuring the test runner executes this file."""
     value = 1 + 1
     assert value == 2
+
+
+def test_panels_package_resolves_panels_lazily():
+    """Built-in panels resolve through the package and unknown names still fail."""
+    import pytest
+
+    from nowplaying import panels
+    from nowplaying.panels.debug_panel import DebugPanel
+
+    assert panels.DebugPanel is DebugPanel
+    assert "DebugPanel" in vars(panels)  # Cached after the first lookup
+    assert "VUMeterPanel" in dir(panels)
+    with pytest.raises(AttributeError):
+        panels.NoSuchPanel  # noqa: B018